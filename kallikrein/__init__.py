@@ -1,4 +1,5 @@
-from kallikrein.expectable import k, unsafe_k, kf
-from kallikrein.expectation import pending, Expectation
+from kallikrein.expectable import k, unsafe_k, kf, kaf
+from kallikrein.expectation import pending, timeout, tag, Expectation
 
-__all__ = ('k', 'unsafe_k', 'pending', 'Expectation', 'kf')
+__all__ = ('k', 'unsafe_k', 'pending', 'timeout', 'tag', 'Expectation', 'kf',
+           'kaf')
@@ -1,11 +1,12 @@
 import abc
-from typing import Generic, TypeVar, Union, Callable, Any
+from typing import Generic, TypeVar, Union, Callable, Any, Awaitable
 
 from kallikrein.match_result import MatchResult
 from kallikrein.matcher import Matcher, BoundMatcher
 from kallikrein.expectation import (UnsafeExpectation, SingleExpectation,
                                     ExpectationFailed, SingleStrictExpectation,
-                                    SingleCallableExpectation)
+                                    SingleCallableExpectation,
+                                    SingleAsyncCallableExpectation)
 from kallikrein.matchers import equal
 from kallikrein.matchers.any import be_any
 
@@ -74,6 +75,13 @@ class CallableExpectable(ExpectableBase):
         return SingleCallableExpectation(matcher, self.value, self.a, self.kw)
 
 
+class AsyncCallableExpectable(CallableExpectable):
+
+    def match(self, matcher: BoundMatcher) -> MatchResult[A]:
+        return SingleAsyncCallableExpectation(matcher, self.value, self.a,
+                                              self.kw)
+
+
 def k(value: A) -> ExpectableBase[A]:
     return Expectable(value)
 
@@ -85,4 +93,9 @@ def unsafe_k(value: A) -> ExpectableBase[A]:
 def kf(value: Callable[..., A], *a: Any, **kw: Any) -> ExpectableBase[A]:
     return CallableExpectable(value, a, kw)
 
+
+def kaf(value: Callable[..., Awaitable[A]], *a: Any, **kw: Any
+        ) -> ExpectableBase[A]:
+    return AsyncCallableExpectable(value, a, kw)
+
 __all__ = ('Expectable', 'k', 'ExpectationFailed', 'UnsafeExpectable')
@@ -12,6 +12,7 @@ from amino.anon import format_funcall
 from kallikrein.matcher import BoundMatcher
 from kallikrein.match_result import MatchResult, SuccessMatchResult
 from kallikrein.util.string import indent, red
+from kallikrein.util.loop import run_async
 
 A = TypeVar('A')
 B = TypeVar('B')
@@ -41,6 +42,45 @@ class ExpectationResult(abc.ABC):
     def report(self) -> str:
         return self.report_lines.join_lines
 
+    @property
+    def pending(self) -> Boolean:
+        return false
+
+    @property
+    def cached(self) -> Boolean:
+        return false
+
+    @property
+    def compact(self) -> 'ExpectationResult':
+        report = self.report_lines if self.failure else List()
+        return CompactExpectationResult(bool(self.success), report,
+                                        bool(self.pending))
+
+
+class CompactExpectationResult(ExpectationResult):
+
+    def __init__(self, success: bool, report_lines: List[str],
+                 pending: bool) -> None:
+        self._success = success
+        self._report_lines = report_lines
+        self._pending = pending
+
+    @property
+    def success(self) -> Boolean:
+        return Boolean(self._success)
+
+    @property
+    def report_lines(self) -> List[str]:
+        return self._report_lines
+
+    @property
+    def pending(self) -> Boolean:
+        return Boolean(self._pending)
+
+    @property
+    def compact(self) -> ExpectationResult:
+        return self
+
 
 class SingleExpectationResult(ExpectationResult):
 
@@ -152,6 +192,47 @@ class PendingExpectationResult(ExpectationResult):
     def report_lines(self) -> List[str]:
         return List('pending')
 
+    @property
+    def pending(self) -> Boolean:
+        return true
+
+
+class CachedExpectationResult(ExpectationResult):
+
+    @property
+    def success(self) -> Boolean:
+        return true
+
+    @property
+    def report_lines(self) -> List[str]:
+        return List()
+
+    @property
+    def cached(self) -> Boolean:
+        return true
+
+    @property
+    def compact(self) -> ExpectationResult:
+        return self
+
+
+class TimeoutSpecResult(ExpectationResult):
+    error_head = 'spec timed out after {}s:'
+
+    def __init__(self, name: str, seconds: float, stack: List[str]) -> None:
+        self.name = name
+        self.seconds = seconds
+        self.stack = stack
+
+    @property
+    def success(self) -> Boolean:
+        return false
+
+    @property
+    def report_lines(self) -> List[str]:
+        head = TimeoutSpecResult.error_head.format(self.seconds)
+        return indent(self.stack).cons(head)
+
 
 class InvalidExpectation(Exception):
 
@@ -309,6 +390,22 @@ def pending(f: Callable[[Any], Expectation]) -> Callable[[Any], Expectation]:
     return wrapper
 
 
+def timeout(seconds: float) -> Callable[[Callable], Callable]:
+    def decorator(f: Callable[[Any], Expectation]
+                  ) -> Callable[[Any], Expectation]:
+        f.__timeout__ = seconds  # type: ignore
+        return f
+    return decorator
+
+
+def tag(*names: str) -> Callable[[A], A]:
+    def decorator(target: A) -> A:
+        tags = tuple(getattr(target, '__tags__', ()))
+        target.__tags__ = tags + names  # type: ignore
+        return target
+    return decorator
+
+
 class SingleCallableExpectation(SingleExpectation):
 
     def __init__(self, match: BoundMatcher, value: Callable[..., A], a: Any,
@@ -330,6 +427,22 @@ class SingleCallableExpectation(SingleExpectation):
         return '{}({}, {})'.format(self.__class__.__name__, self.match,
                                    format_funcall(self.value, self.a, self.kw))
 
+
+class SingleAsyncCallableExpectation(SingleCallableExpectation):
+
+    def _await(self) -> A:
+        return run_async(self.value(*self.a, **self.kw))
+
+    @property
+    def evaluate(self) -> Task[ExpectationResult]:
+        return (
+            Task.delay(self._await) /
+            self.match.evaluate /
+            L(SingleExpectationResult)(self, _)
+        )
+
 __all__ = ('Expectation', 'SingleExpectation', 'UnsafeExpectation',
            'unsafe_expectation_result', 'FatalSpec', 'FailedUnsafeSpec',
-           'pending', 'SingleStrictExpectation')
+           'pending', 'SingleStrictExpectation',
+           'SingleAsyncCallableExpectation', 'timeout', 'TimeoutSpecResult',
+           'CachedExpectationResult', 'tag')
@@ -1,13 +1,11 @@
 import abc
-from typing import Generic, TypeVar, Any
-
-from hues import huestr
+from typing import Generic, TypeVar, Any, Callable
 
 from amino import Boolean, List, _
 from amino.boolean import false
 from amino.lazy import lazy
 
-from kallikrein.util.string import indent
+from kallikrein.util.string import indent, yellow
 
 A = TypeVar('A')
 B = TypeVar('B')
@@ -54,6 +52,19 @@ class SimpleMatchResult(Generic[A], MatchResult[A]):
         return self.msg
 
 
+class LazyMatchResult(Generic[A], SimpleMatchResult[A]):
+
+    def __init__(self, result: bool, render: Callable[[], List[str]]) -> None:
+        self.result = Boolean(result)
+        self.render = render
+        if not result:
+            self.msg
+
+    @lazy
+    def msg(self) -> List[str]:
+        return self.render()
+
+
 class MultiLineMatchResult(Generic[A], MatchResult[A]):
 
     def __init__(self, result: bool, msg: List[str]) -> None:
@@ -107,7 +118,7 @@ class NestedMatchResultBase(MatchResult):
         msgs = n // _.report_lines
         return (msgs
                 if self.nested_success else
-                msgs / huestr / _.yellow.colorized)
+                msgs / yellow)
 
 
 # TODO allow empty nested list, in which case omit from message
@@ -265,4 +276,4 @@ class MatchResultOr(MatchResultAlg):
 
 __all__ = ('MatchResult', 'SimpleMatchResult', 'MultiLineMatchResult', 'NestedMatchResult', 'MultiMatchResult',
            'ExistsMatchResult', 'ForAllMatchResult', 'BadNestedMatch', 'SuccessMatchResult', 'FailureMatchResult',
-           'ContainsMatchResult')
+           'ContainsMatchResult', 'LazyMatchResult')
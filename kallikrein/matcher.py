@@ -1,7 +1,7 @@
 import abc
 from typing import Generic, TypeVar, Union, Callable, Type, cast
 
-from kallikrein.match_result import (MatchResult, SimpleMatchResult,
+from kallikrein.match_result import (MatchResult, LazyMatchResult,
                                      BadNestedMatch, MatchResultAnd,
                                      MatchResultOr, MatchResultAlg)
 
@@ -175,8 +175,8 @@ class TCMatcher(Matcher[A]):
 
     def match(self, exp: A, target: B) -> MatchResult[A]:
         success = self.check_pred(exp, target)
-        message = self.format(success, exp, target)
-        return SimpleMatchResult(success, message)
+        return LazyMatchResult(success,
+                               lambda: self.format(success, exp, target))
 
     def match_nested(self, exp: A, target: BoundMatcher) -> MatchResult[A]:
         nest = self.nest(exp)
@@ -3,7 +3,7 @@ import operator
 from typing import Tuple, Callable
 from numbers import Number
 
-from kallikrein.match_result import MatchResult, SimpleMatchResult, BadNestedMatch
+from kallikrein.match_result import MatchResult, LazyMatchResult, BadNestedMatch
 from kallikrein.matcher import Matcher, BoundMatcher
 from amino import Boolean, L, _, List
 
@@ -22,8 +22,9 @@ class Comparison(Matcher[Number]):
         result = Boolean(self.operator(exp, target))
         op_s, op_f = self.operator_reprs
         op = op_s if result else op_f
-        message = '{} {} {}'.format(exp, op, target)
-        return SimpleMatchResult(result, List(message))
+        def message() -> List[str]:
+            return List('{} {} {}'.format(exp, op, target))
+        return LazyMatchResult(result, message)
 
     def match_nested(self, exp: Number, target: BoundMatcher) -> MatchResult[Number]:
         return BadNestedMatch(self)
@@ -1,13 +1,11 @@
 from typing import Sequence, Generic, TypeVar, Union
 from difflib import SequenceMatcher
 
-from hues import huestr
-
 from amino import Boolean, _, L, List, __
 from amino.list import Lists
 
 from kallikrein.matcher import BoundMatcher, Predicate, Nesting, SimpleTCMatcherBase
-from kallikrein.util.string import green_plus, red_minus
+from kallikrein.util.string import green_plus, red_minus, yellow, blue
 from kallikrein.match_result import MatchResult, ForAllMatchResult
 
 A = TypeVar('A')
@@ -52,14 +50,14 @@ class NestLinesSeq(NestLines[Strs, MatchResult[Strs]], pred=is_seq):
 def lines_match(exp: List[str], target: List[str]) -> List[str]:
     return List('Lines are equal')
 
-sep = huestr('---').yellow.colorized
+sep = yellow('---')
 
 
 def lines_mismatch(exp: List[str], target: List[str]) -> str:
     pad = len(str(len(exp)))
     def make(index: Union[str, int], inserted: bool, line: str) -> str:
         sign = green_plus if inserted else red_minus
-        i = huestr(f'{index: >{pad}}').blue.colorized
+        i = blue(f'{index: >{pad}}')
         return f'{sign} {i} {line}'
     def replace(start: int, index: List[int], pre: List[str], post: List[str]) -> List[str]:
         return index.zip(pre, post).flat_map3(lambda i, a, b: List(make(i, False, a), make('', True, b)))
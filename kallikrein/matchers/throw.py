@@ -1,7 +1,7 @@
 from typing import Callable, Any
 
 from kallikrein.matcher import Matcher
-from kallikrein.match_result import MatchResult, SimpleMatchResult, MultiLineMatchResult
+from kallikrein.match_result import MatchResult, LazyMatchResult, MultiLineMatchResult
 from kallikrein.util.string import indent
 
 from amino import Either, _, Try, L, List
@@ -23,14 +23,16 @@ class Throw(Matcher[Callable]):
         exc = self.exception(exp)
         result = exc.exists(L(isinstance)(_, target))
         name = exc / (lambda a: a.__class__.__name__)
-        exp_repr = lambda_str(exp)
-        exc_repr = name / '`{}`'.format | Throw.no_exception
-        message = (
-            Throw.simple_success.format(exp_repr, exc_repr)
-            if result else
-            Throw.simple_failure.format(exp_repr, exc_repr, target.__name__)
-        )
-        return SimpleMatchResult(result, List(message))
+        def message() -> List[str]:
+            exp_repr = lambda_str(exp)
+            exc_repr = name / '`{}`'.format | Throw.no_exception
+            return List(
+                Throw.simple_success.format(exp_repr, exc_repr)
+                if result else
+                Throw.simple_failure.format(exp_repr, exc_repr,
+                                            target.__name__)
+            )
+        return LazyMatchResult(result, message)
 
     def match_nested(self, exp: Callable, target: Matcher) -> MatchResult[Callable]:
         exp_repr = lambda_str(exp)
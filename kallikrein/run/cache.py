@@ -0,0 +1,96 @@
+import os
+import json
+import hashlib
+
+from amino import List, Maybe, Try, Path, Map, L, _
+from amino.logging import Logging
+
+from kallikrein.run.line import ResultLine
+from kallikrein.run.data import SpecLocation
+from kallikrein.run.history import location_key
+from kallikrein.run.imports import ImportGraph
+
+
+def file_hash(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class SourceHasher:
+
+    def __init__(self, root: str) -> None:
+        self.graph = ImportGraph(root)
+        self.hashes = dict()  # type: dict
+        self.specs = dict()  # type: dict
+
+    def file_hash(self, path: str) -> str:
+        if path not in self.hashes:
+            self.hashes[path] = file_hash(path)
+        return self.hashes[path]
+
+    def spec_hash(self, mod: str) -> Maybe[str]:
+        if mod not in self.specs:
+            self.specs[mod] = self.graph.module_file(mod) / self._spec_hash
+        return self.specs[mod]
+
+    def _spec_hash(self, path: str) -> str:
+        h = hashlib.sha1()
+        for dep in self.graph.closure(path):
+            h.update(dep.encode())
+            h.update(self.file_hash(dep).encode())
+        return h.hexdigest()
+
+
+class ResultCache(Logging):
+    default_path = Path('.kallikrein') / 'results.json'
+
+    @staticmethod
+    def load(path: Path=None) -> 'ResultCache':
+        path = path or ResultCache.default_path
+        def read() -> dict:
+            with path.open() as f:
+                return json.load(f)
+        data = Try(read).to_maybe.filter(L(isinstance)(_, dict)) | dict()
+        return ResultCache(path, data, SourceHasher(os.getcwd()))
+
+    def __init__(self, path: Path, data: dict, hasher: SourceHasher) -> None:
+        self.path = path
+        self.data = data
+        self.hasher = hasher
+
+    def passed(self, loc: SpecLocation) -> List[str]:
+        entry = self.data.get(location_key(loc), dict())
+        current = self.hasher.spec_hash(loc.mod)
+        return (
+            List.wrap(entry.get('passed', []))
+            if current.contains(entry.get('hash')) else
+            List()
+        )
+
+    def update(self, loc: SpecLocation, names: Map, results: List[ResultLine]
+               ) -> None:
+        for current in self.hasher.spec_hash(loc.mod):
+            key = location_key(loc)
+            entry = self.data.get(key, dict())
+            passed = (
+                set(entry.get('passed', []))
+                if entry.get('hash') == current else
+                set()
+            )
+            for line in results:
+                for name in names.lift(line.text):
+                    if line.success:
+                        passed.add(name)
+                    else:
+                        passed.discard(name)
+            self.data[key] = dict(hash=current, passed=sorted(passed))
+
+    def save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open('w') as f:
+                json.dump(self.data, f, indent=1, sort_keys=True)
+        except OSError as e:
+            self.log.warning('could not write result cache: {}'.format(e))
+
+__all__ = ('ResultCache', 'SourceHasher')
@@ -5,13 +5,34 @@ from golgi import Config, cli
 
 from amino import _
 
-from kallikrein.run.main import kallikrein_run_lazy
+from kallikrein.run.main import (kallikrein_run_lazy, kallikrein_merge,
+                                 kallikrein_watch)
+from kallikrein.run.output import use_output, LogOutput, flushing_logs
 
 
 @cli(positional=(('specs', '*'),))
 def klk() -> int:
     sys.path.insert(0, os.getcwd())
-    specs = Config['run'].specs
-    return 0 if kallikrein_run_lazy(specs).exists(_.success) else 1
+    conf = Config['run']
+    if conf.log_output:
+        use_output(LogOutput())
+    max_failures = 1 if conf.fail_fast else conf.max_failures
+    options = dict(jobs=conf.jobs, compact=conf.compact,
+                   max_failures=max_failures, timeout=conf.timeout,
+                   durations=conf.durations, incremental=conf.incremental,
+                   keyword=conf.keyword, shard=conf.shard,
+                   shard_result=conf.shard_result,
+                   shard_history=conf.shard_history, junit=conf.junit,
+                   json_lines=conf.json_lines, quiet=conf.quiet,
+                   trace=conf.trace)
+    with flushing_logs():
+        result = (
+            kallikrein_merge(conf.specs, durations=conf.durations)
+            if conf.merge else
+            kallikrein_watch(conf.specs, **options)
+            if conf.watch else
+            kallikrein_run_lazy(conf.specs, **options)
+        )
+    return 0 if result.exists(_.success) else 1
 
 __all__ = ('klk',)
@@ -1,6 +1,7 @@
 from typing import Any, Dict
 
-from golgi.config import ListConfigOption
+from golgi.config import (ListConfigOption, IntConfigOption, BoolConfigOption,
+                          FloatConfigOption, UnicodeConfigOption)
 
 metadata = dict(parents=['golgi'])
 
@@ -9,5 +10,45 @@ def reset_config() -> Dict[str, Any]:
     return {
         'run': dict(
             specs=ListConfigOption(),
+            jobs=IntConfigOption(1, short='j',
+                                 help='number of worker processes'),
+            quiet=BoolConfigOption(
+                False, short='q',
+                help='only print failures and the stats'),
+            log_output=BoolConfigOption(
+                False,
+                help='print the report through the logger instead of stdout'),
+            compact=BoolConfigOption(
+                False,
+                help='keep only compact summaries of finished specs'),
+            max_failures=IntConfigOption(
+                0, help='stop running specs after this many failures'),
+            fail_fast=BoolConfigOption(
+                False, short='x', help='stop running specs after a failure'),
+            timeout=FloatConfigOption(
+                0., help='default timeout in seconds for each spec'),
+            durations=IntConfigOption(
+                0, help='report this many of the slowest specs and classes'),
+            incremental=BoolConfigOption(
+                False, help='only run specs that changed or did not pass'),
+            keyword=UnicodeConfigOption(
+                '', short='k',
+                help='only run specs matching this keyword expression'),
+            shard=UnicodeConfigOption(
+                '', help='only run shard `i/n` of the specs'),
+            shard_result=UnicodeConfigOption(
+                '', help='file for the results of a shard'),
+            shard_history=UnicodeConfigOption(
+                '', help='duration history used to balance the shards'),
+            watch=BoolConfigOption(
+                False, help='rerun affected specs when source files change'),
+            junit=UnicodeConfigOption(
+                '', help='write a JUnit XML report to this file'),
+            json_lines=UnicodeConfigOption(
+                '', help='stream spec results as JSON lines to this file'),
+            trace=UnicodeConfigOption(
+                '', help='write a trace of the run timeline to this file'),
+            merge=BoolConfigOption(
+                False, help='report the merged shard results given as specs'),
         ),
     }
@@ -1,16 +1,23 @@
 import inspect
+import importlib
 from typing import Any
 from types import FunctionType
 from datetime import timedelta
 
-from amino import Maybe, Either, L, _, Right, Empty, List, Boolean, Path
+from amino import (Maybe, Either, L, _, Right, Empty, List, Boolean, Path,
+                   Just, Try)
 from amino.list import Lists
 from amino.logging import Logging
 from amino.util.string import snake_case
 from amino.instances.std.datetime import TimedeltaInstances  # NOQA
 from amino.lazy import lazy
 
-from kallikrein.run.line import Line, ResultLine
+from kallikrein.run.line import (Line, ResultLine, SkippedLine, PlainLine,
+                                 line_from_data)
+from kallikrein.run.timing import SpecTiming, format_ns
+from kallikrein.run.index import ClassEntry
+from kallikrein.run.output import output, flush_output
+from kallikrein.run.trace import tracer
 from kallikrein.util.string import green_check, red_cross
 
 
@@ -80,11 +87,13 @@ def convert_underscores(data: str) -> str:
     return data.replace('_', ' ')
 
 
-invalid_spec_names = List('setup', 'teardown')
+invalid_spec_names = List('setup', 'teardown', 'setup_class',
+                          'teardown_class')
 
 
 class SpecLocation:
     no_docstring_msg = 'spec class `{}` has no docstring'
+    no_class_msg = '`{}` in `{}` is not a class'
 
     @staticmethod
     def create(mod: str, cls: str, meth: Maybe[str], selector: Selector,
@@ -116,25 +125,82 @@ class SpecLocation:
             .map3(create)
         )
 
+    @staticmethod
+    def deferred(mod: str, entry: ClassEntry, meth: Maybe[str],
+                 selector: Selector, allow_empty: bool=False
+                 ) -> 'SpecLocation':
+        return SpecLocation(mod, None, meth, selector, allow_empty,
+                            Just(entry))
+
     def __init__(self, mod: str, cls: type, meth: Maybe[str],
-                 selector: Selector, allow_empty: bool=False) -> None:
+                 selector: Selector, allow_empty: bool=False,
+                 entry: Maybe[ClassEntry]=Empty()) -> None:
         self.mod = mod
-        self.cls = cls
+        self._cls = cls
         self.meth = meth
         self.selector = selector
         self.allow_empty = Boolean(allow_empty)
+        self.entry = entry
+        self.import_error = Empty()  # type: Maybe[Exception]
 
     def __str__(self) -> str:
         return '{}({}, {}, {}, {})'.format(self.__class__.__name__, self.mod,
-                                           self.cls, self.meth,
+                                           self.cls_name, self.meth,
                                            self.allow_empty)
 
     def __repr__(self) -> str:
         return str(self)
 
+    def __getstate__(self) -> dict:
+        return dict(mod=self.mod, cls=self._cls, meth=self.meth | None,
+                    selector=self.selector, allow_empty=bool(self.allow_empty),
+                    entry=self.entry / _.data | None)
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state['mod'], state['cls'], Maybe(state['meth']),  # type: ignore
+                      state['selector'], state['allow_empty'],
+                      Maybe(state['entry']) / ClassEntry.from_data)
+
+    @property
+    def cls_name(self) -> str:
+        return self.entry / _.name | (lambda: self._cls.__name__)
+
+    @property
+    def cls(self) -> Either[str, type]:
+        if self._cls is not None:
+            return Right(self._cls)
+        err = SpecLocation.no_class_msg.format(self.cls_name, self.mod)
+        import_err = 'error importing {}: {}'
+        with tracer.span('import', 'import', module=self.mod):
+            module = Try(importlib.import_module, self.mod)
+        cls = (
+            module.lmap(lambda e: import_err.format(self.mod, e.cause)) //
+            (lambda m: Maybe.getattr(m, self.cls_name)
+             .filter(inspect.isclass)
+             .to_either(err))
+        )
+        self._cls = cls | None
+        self.import_error = module.swap.to_maybe / _.cause
+        return cls
+
+    @property
+    def imported(self) -> bool:
+        return self._cls is not None
+
+    def defines(self, name: str) -> bool:
+        return self.entry.exists(L(ClassEntry.defines)(_, name))
+
+    def tags(self, name: str) -> List[str]:
+        def attr_tags(target: Any) -> List[str]:
+            return List.wrap(getattr(target, '__tags__', ()))
+        def dynamic(cls: type) -> List[str]:
+            return attr_tags(cls) + attr_tags(getattr(cls, name, None))
+        return self.entry.cata(L(ClassEntry.tags)(_, name),
+                               lambda: self.cls / dynamic | List())
+
     @property
     def use_all_specs(self) -> Boolean:
-        return Boolean(hasattr(self.cls, '__all_specs__'))
+        return Boolean(self.cls.exists(L(hasattr)(_, '__all_specs__')))
 
     @property
     def need_no_doc(self) -> Boolean:
@@ -148,7 +214,7 @@ class SpecLocation:
                 not member.__name__.startswith('_') and
                 member.__name__ not in invalid_spec_names
             )
-        valid = inspect.getmembers(self.cls, predicate=filt)
+        valid = self.cls / L(inspect.getmembers)(_, predicate=filt) | []
         return Lists.wrap(valid) / Lists.wrap // _.head
 
     @property
@@ -156,39 +222,144 @@ class SpecLocation:
         meth = lambda name: '{} ${}'.format(convert_underscores(name), name)
         def synthetic() -> List[str]:
             meths = (self.meth / meth / List) | (self.cls_methods / meth)
-            cls = convert_underscores(snake_case(self.cls.__name__))
+            cls = convert_underscores(snake_case(self.cls_name))
             return meths.cons(cls).join_lines
         return self.need_no_doc.m(synthetic)
 
     @property
     def doc(self) -> Either[str, str]:
-        return (
-            Maybe(self.cls.__doc__)
-            .o(lambda: self.fallback_doc)
-            .to_either(SpecLocation.no_docstring_msg.format(self.cls.__name__))
-        )
+        err = SpecLocation.no_docstring_msg.format(self.cls_name)
+        def dynamic(cls: type) -> Either[str, str]:
+            return (
+                Maybe(cls.__doc__)
+                .o(lambda: self.fallback_doc)
+                .to_either(err)
+            )
+        return (self.entry // _.doc) / Right | (lambda: self.cls // dynamic)
+
+
+class FailureLimit:
+
+    def __init__(self, max_failures: int) -> None:
+        self.max_failures = max_failures
+        self.failures = 0
+
+    @property
+    def reached(self) -> bool:
+        return 0 < self.max_failures <= self.failures
+
+    def record(self, line: Line) -> None:
+        if line.failed:
+            self.failures += 1
 
 
 class SpecResult(Logging):
 
-    def __init__(self, results: List[Line]) -> None:
+    def __init__(self, results: List[Line], key: str='') -> None:
         self.results = results
+        self.key = key
 
-    @property
+    @lazy
     def report_lines(self) -> List[str]:
         return self.results // _.output_lines
 
+    @property
+    def title(self) -> str:
+        return (
+            self.results
+            .filter_type(PlainLine)
+            .find(_.text) /
+            _.text |
+            ''
+        )
+
+    @property
+    def spec_results(self) -> List[ResultLine]:
+        return self.results.filter_type(ResultLine)
+
+    @property
+    def timing(self) -> SpecTiming:
+        return sum(self.spec_results / _.timing, SpecTiming())
+
+    @property
+    def data(self) -> list:
+        return list(self.results / _.data)
+
+    @property
+    def label(self) -> str:
+        return self.key or self.title
+
+    @staticmethod
+    def from_data(data: list, key: str='') -> 'SpecResult':
+        return SpecResult(List.wrap(data) / line_from_data, key)
+
+
+class Duration:
+
+    def __init__(self, name: str, ns: int, share: float) -> None:
+        self.name = name
+        self.ns = ns
+        self.share = share
+
+    @property
+    def seconds(self) -> float:
+        return self.ns / 1e9
+
+    @property
+    def report_line(self) -> str:
+        return '  {:>9} {:>6.1%}  {}'.format(format_ns(self.ns), self.share,
+                                             self.name)
+
+    @property
+    def data(self) -> dict:
+        return dict(name=self.name, seconds=self.seconds, share=self.share)
+
+    def __str__(self) -> str:
+        return '{}({}, {})'.format(self.__class__.__name__, self.name,
+                                   format_ns(self.ns))
+
+
+class Durations:
+
+    def __init__(self, specs: List[Duration], classes: List[Duration]) -> None:
+        self.specs = specs
+        self.classes = classes
+
+    @property
+    def report_lines(self) -> List[str]:
+        return (
+            (self.specs / _.report_line).cons('slowest specs:') +
+            (self.classes / _.report_line).cons('slowest spec classes:')
+        )
+
+    @property
+    def data(self) -> dict:
+        return dict(specs=list(self.specs / _.data),
+                    classes=list(self.classes / _.data))
+
 
 class SpecsResult(Logging):
 
-    def __init__(self, specs: List[SpecResult]) -> None:
+    def __init__(self, specs: List[SpecResult], elapsed: int=0) -> None:
         self.specs = specs
+        self.elapsed = elapsed
 
     @property
+    def data(self) -> list:
+        return list(self.specs / _.data)
+
+    @staticmethod
+    def from_data(data: list, keys: List[str]=List(), elapsed: int=0
+                  ) -> 'SpecsResult':
+        specs = List.wrap(data).with_index.map2(
+            lambda i, a: SpecResult.from_data(a, keys.lift(i) | ''))
+        return SpecsResult(specs, elapsed)
+
+    @lazy
     def report_lines(self) -> List[str]:
         return self.specs // _.report_lines
 
-    @property
+    @lazy
     def report(self) -> str:
         return self.report_lines.join_lines
 
@@ -200,6 +371,10 @@ class SpecsResult(Logging):
     def duration(self) -> timedelta:
         return (self.results / _.duration).fold(timedelta)
 
+    @lazy
+    def timing(self) -> SpecTiming:
+        return sum(self.results / _.timing, SpecTiming())
+
     @property
     def duration_fmt(self) -> str:
         d = self.duration
@@ -228,19 +403,31 @@ class SpecsResult(Logging):
     def failure_count(self) -> int:
         return self.results.length - self.success_count
 
+    @property
+    def skipped_count(self) -> int:
+        return (self.specs // _.results).filter_type(SkippedLine).length
+
+    @property
+    def cached_count(self) -> int:
+        return self.results.filter(_.result.cached).length
+
     @property
     def success(self) -> bool:
         return self.failure_count == 0
 
     @property
     def stats(self) -> str:
-        return '{} specs in {}:  {} {}  {} {}'.format(
+        skipped = self.skipped_count
+        cached = self.cached_count
+        return '{} specs in {}:  {} {}  {} {}{}{}'.format(
             self.results.length,
             self.duration_fmt,
             green_check,
             self.success_count,
             red_cross,
-            self.failure_count
+            self.failure_count,
+            '  {} skipped'.format(skipped) if skipped else '',
+            '  {} cached'.format(cached) if cached else ''
         )
 
     @property
@@ -248,17 +435,35 @@ class SpecsResult(Logging):
         return List(self.stats)
 
     def print_stats(self) -> None:
-        self.stats_lines % self.log.info
+        output().write(self.stats_lines)
+
+    def durations(self, count: int) -> Durations:
+        wall = max(self.elapsed or self.timing.wall, 1)
+        def duration(name: str, ns: int) -> Duration:
+            return Duration(name, ns, ns / wall)
+        def spec(cls: SpecResult, line: ResultLine) -> Duration:
+            return duration('{}: {}'.format(cls.label, line.text),
+                            line.timing.total)
+        def slowest(durations: List[Duration]) -> List[Duration]:
+            return durations.sort_by(_.ns, reverse=True).take(count)
+        specs = self.specs // (lambda c: c.spec_results / L(spec)(c, _))
+        classes = self.specs / (lambda c: duration(c.label, c.timing.wall))
+        return Durations(slowest(specs), slowest(classes))
+
+    def print_durations(self, count: int) -> None:
+        output().write(self.durations(count).report_lines)
 
     @property
     def report_with_stats_lines(self) -> List[str]:
-        return self.report_lines.cat(self.stats_lines)
+        return self.report_lines + self.stats_lines
 
     @property
     def report_with_stats(self) -> str:
         return self.report_with_stats_lines.join_lines
 
     def print_report(self) -> None:
-        self.report_with_stats_lines % self.log.info
+        output().write(self.report_with_stats_lines)
+        flush_output()
 
-__all__ = ('SpecLocation', 'SpecResult', 'SpecsResult')
+__all__ = ('SpecLocation', 'SpecResult', 'SpecsResult', 'FailureLimit',
+           'Duration', 'Durations')
@@ -0,0 +1,101 @@
+import json
+from typing import Callable, TypeVar
+
+from amino import List, Maybe, Try, Path, Map, L, _
+from amino.logging import Logging
+
+from kallikrein.run.data import SpecLocation, SpecResult
+from kallikrein.run.line import SkippedLine
+
+A = TypeVar('A')
+
+
+def location_key(loc: SpecLocation) -> str:
+    return '{}.{}'.format(loc.mod, loc.cls_name)
+
+
+def spec_key(loc: SpecLocation, name: str) -> str:
+    return '{}.{}'.format(location_key(loc), name)
+
+
+def estimates(known: List[Maybe[int]]) -> List[int]:
+    values = known.join
+    mean = sum(values) // max(len(values), 1)
+    return known / (lambda a: a | mean)
+
+
+def longest_first(items: List[A], duration: Callable[[A], Maybe[int]]
+                  ) -> List[A]:
+    known = items / duration
+    return (
+        items.zip(estimates(known))
+        .sort_by(lambda a: a[1], reverse=True) /
+        (lambda a: a[0])
+        if known.exists(_.is_just) else
+        items
+    )
+
+
+class DurationHistory(Logging):
+    default_path = Path('.kallikrein') / 'durations.json'
+
+    @staticmethod
+    def load(path: Path=None) -> 'DurationHistory':
+        path = path or DurationHistory.default_path
+        def read() -> dict:
+            with path.open() as f:
+                return json.load(f)
+        data = Try(read).to_maybe.filter(L(isinstance)(_, dict)) | dict()
+        return DurationHistory(path, data)
+
+    def __init__(self, path: Path, data: dict) -> None:
+        self.path = path
+        self.data = data
+
+    def get(self, key: str) -> Maybe[int]:
+        return Maybe(self.data.get(key))
+
+    def duration(self, loc: SpecLocation) -> Maybe[int]:
+        return self.get(location_key(loc))
+
+    def spec_durations(self, loc: SpecLocation, names: List[str]) -> Map:
+        return Map(
+            (names / (lambda a: (a, self.get(spec_key(loc, a)))))
+            .filter(lambda a: a[1].is_just)
+            .map2(lambda a, b: (a, b | 0))
+        )
+
+    def schedule(self, items: List[A], location: Callable[[A], SpecLocation]
+                 ) -> List[A]:
+        return longest_first(items, lambda a: self.duration(location(a)))
+
+    def update(self, key: str, spec: SpecResult, names: Map,
+               specs: List[str]=List()) -> None:
+        def record(key: str, ns: int) -> None:
+            if ns > 0:
+                self.data[key] = ns
+        fresh = spec.spec_results.filter_not(_.result.cached)
+        ran = fresh // (lambda a: names.lift(a.text).to_list)
+        for line in fresh:
+            for name in names.lift(line.text):
+                record('{}.{}'.format(key, name), line.timing.total)
+        complete = (
+            fresh.length == spec.spec_results.length and
+            spec.results.filter_type(SkippedLine).is_empty and
+            specs.forall(ran.contains)
+        )
+        if complete:
+            record(key, spec.timing.wall)
+        else:
+            known = specs / (lambda a: self.get('{}.{}'.format(key, a)))
+            record(key, sum(known.join))
+
+    def save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open('w') as f:
+                json.dump(self.data, f, indent=1, sort_keys=True)
+        except OSError as e:
+            self.log.warning('could not write duration history: {}'.format(e))
+
+__all__ = ('DurationHistory', 'location_key', 'spec_key', 'longest_first')
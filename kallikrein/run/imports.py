@@ -0,0 +1,99 @@
+import os
+import sys
+from importlib.util import resolve_name
+from typing import Set, Iterable
+
+from amino import List, Maybe, Try, Path
+
+from kallikrein.run.index import index, Import
+from kallikrein.run.lookup_loc import resolve_module, init_name
+
+
+def module_name(path: str) -> str:
+    name = resolve_module(Path(path))
+    return (
+        name.rpartition('.')[0]
+        if os.path.basename(path) == init_name else
+        name
+    )
+
+
+def imported_names(module: str, package: bool, imports: List[Import]
+                   ) -> List[str]:
+    base = module if package else module.rpartition('.')[0]
+    def absolute(level: int, name: str) -> Maybe[str]:
+        return (
+            Try(resolve_name, '.' * level + name, base).to_maybe
+            if level else
+            Maybe(name).filter(bool)
+        )
+    def names(imp: Import) -> List[str]:
+        level, name, members = imp
+        return absolute(level, name).to_list // (
+            lambda a: (List.wrap(members) / (lambda b: '{}.{}'.format(a, b)))
+            .cons(a)
+        )
+    return imports // names
+
+
+def search_module(name: str) -> Maybe[str]:
+    parts = name.split('.')
+    def candidates(entry: str) -> List[str]:
+        base = os.path.join(entry or os.curdir, *parts)
+        return List(base + '.py', os.path.join(base, init_name))
+    loaded = Maybe(sys.modules.get(name)) // (
+        lambda a: Maybe(getattr(a, '__file__', None)))
+    return loaded.o(
+        lambda: (List.wrap(sys.path) // candidates).find(os.path.isfile))
+
+
+class ImportGraph:
+
+    def __init__(self, root: str) -> None:
+        self.root = os.path.join(os.path.abspath(root), '')
+        self.files = dict()  # type: dict
+        self.imports = dict()  # type: dict
+
+    def local(self, path: str) -> bool:
+        return path.startswith(self.root) and os.path.isfile(path)
+
+    def module_file(self, name: str) -> Maybe[str]:
+        if name not in self.files:
+            self.files[name] = (
+                search_module(name) /
+                os.path.abspath
+            ).filter(self.local)
+        return self.files[name]
+
+    def module_imports(self, path: str) -> List[str]:
+        if path not in self.imports:
+            package = os.path.basename(path) == init_name
+            self.imports[path] = (
+                index().entry(Path(path)) /
+                (lambda a: imported_names(module_name(path), package,
+                                          a.imports)) |
+                List()
+            )
+        return self.imports[path]
+
+    def dependencies(self, path: str) -> List[str]:
+        files = self.module_imports(path) // (
+            lambda a: self.module_file(a).to_list)
+        return files.distinct.filter(lambda a: a != path)
+
+    def closure(self, path: str) -> List[str]:
+        seen = {path}  # type: Set[str]
+        queue = [path]
+        while queue:
+            for dep in self.dependencies(queue.pop()):
+                if dep not in seen:
+                    seen.add(dep)
+                    queue.append(dep)
+        return List.wrap(sorted(seen))
+
+    def invalidate(self, paths: Iterable[str]) -> None:
+        for path in paths:
+            self.imports.pop(os.path.abspath(path), None)
+        self.files.clear()
+
+__all__ = ('ImportGraph', 'imported_names', 'module_name')
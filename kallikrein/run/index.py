@@ -0,0 +1,314 @@
+import os
+import re
+import ast
+import json
+import bisect
+from typing import Tuple, Any, Iterable
+
+from amino import List, Either, Maybe, Path, Try, L, _, Empty, Map
+from amino.logging import Logging
+
+spec_regex = r'\s*(?P<text>[^#\s][^\$]+)\$(?P<spec>\w+)'
+spec_pattern = re.compile(spec_regex)
+Import = Tuple[int, str, Tuple[str, ...]]
+
+
+class ClassEntry:
+
+    def __init__(self, name: str, start: int, end: int, doc: Maybe[str],
+                 specs: List[str], methods: List[tuple],
+                 tags: List[str]=List(), spec_tags: Map=Map()) -> None:
+        self.name = name
+        self.start = start
+        self.end = end
+        self.doc = doc
+        self.specs = specs
+        self.methods = methods
+        self.class_tags = tags
+        self.spec_tags = spec_tags
+        self.method_lines = list(methods / (lambda a: a[1]))
+
+    @staticmethod
+    def from_data(data: dict) -> 'ClassEntry':
+        return ClassEntry(data['name'], data['start'], data['end'],
+                          Maybe(data['doc']), List.wrap(data['specs']),
+                          List.wrap(data['methods']) / tuple,
+                          List.wrap(data['tags']),
+                          Map(data['spec_tags']).valmap(List.wrap))
+
+    @property
+    def data(self) -> dict:
+        return dict(name=self.name, start=self.start, end=self.end,
+                    doc=self.doc | None, specs=list(self.specs),
+                    methods=list(self.methods / list),
+                    tags=list(self.class_tags),
+                    spec_tags=dict(self.spec_tags.valmap(list)))
+
+    def tags(self, name: str) -> List[str]:
+        return self.class_tags + self.spec_tags.lift(name).get_or_else(List())
+
+    def contains(self, lnum: int) -> bool:
+        return self.start <= lnum <= self.end
+
+    def defines(self, name: str) -> bool:
+        return self.methods.exists(lambda a: a[0] == name)
+
+    def method_at(self, lnum: int) -> Maybe[str]:
+        index = bisect.bisect_right(self.method_lines, lnum) - 1
+        return (
+            self.methods.lift(index) / (lambda a: a[0])
+            if index >= 0 else
+            Empty()
+        )
+
+    def __str__(self) -> str:
+        return '{}({}, {}-{})'.format(self.__class__.__name__, self.name,
+                                      self.start, self.end)
+
+
+class FileEntry:
+
+    def __init__(self, mtime: float, size: int, classes: List[ClassEntry],
+                 exports: Maybe[List[str]], imports: List[Import]) -> None:
+        self.mtime = mtime
+        self.size = size
+        self.classes = classes
+        self.exports = exports
+        self.imports = imports
+        self.starts = list(classes / _.start)
+
+    @staticmethod
+    def from_data(data: dict) -> 'FileEntry':
+        return FileEntry(data['mtime'], data['size'],
+                         List.wrap(data['classes']) / ClassEntry.from_data,
+                         Maybe(data['exports']) / List.wrap,
+                         List.wrap(data['imports']) /
+                         (lambda a: (a[0], a[1], tuple(a[2]))))
+
+    @property
+    def data(self) -> dict:
+        return dict(mtime=self.mtime, size=self.size,
+                    classes=list(self.classes / _.data),
+                    exports=self.exports / list | None,
+                    imports=list(self.imports))
+
+    def cls(self, name: str) -> Maybe[ClassEntry]:
+        return self.classes.find(_.name == name)
+
+    @property
+    def exported_classes(self) -> Maybe[List[ClassEntry]]:
+        return self.exports // (lambda a: a.traverse(self.cls, Maybe))
+
+    def valid(self, stat: os.stat_result) -> bool:
+        return self.mtime == stat.st_mtime and self.size == stat.st_size
+
+    def class_at(self, lnum: int) -> Maybe[ClassEntry]:
+        index = bisect.bisect_right(self.starts, lnum) - 1
+        return (
+            self.classes.lift(index).filter(L(ClassEntry.contains)(_, lnum))
+            if index >= 0 else
+            Empty()
+        )
+
+    def __str__(self) -> str:
+        return '{}({})'.format(self.__class__.__name__, self.classes / _.name)
+
+
+def doc_specs(doc: str) -> List[str]:
+    matches = List.lines(doc) / spec_pattern.match
+    return (
+        matches.filter(lambda a: a is not None) /
+        (lambda a: a.group('spec'))
+    )
+
+
+def node_name(node: ast.expr) -> str:
+    return getattr(node, 'id', '')
+
+
+def literal_strings(node: ast.expr) -> List[str]:
+    def strings(value: Any) -> List[str]:
+        values = (
+            List(value)
+            if isinstance(value, str) else
+            List.wrap(value)
+            if isinstance(value, (tuple, list)) else
+            List()
+        )
+        return values.filter(L(isinstance)(_, str))
+    return Try(ast.literal_eval, node).to_maybe / strings | List()
+
+
+def tag_call(node: ast.expr) -> bool:
+    func = getattr(node, 'func', None)
+    name = node_name(func) or getattr(func, 'attr', '')
+    return isinstance(node, ast.Call) and name == 'tag'
+
+
+def decorator_tags(node: ast.AST) -> List[str]:
+    calls = List.wrap(node.decorator_list).filter(tag_call)
+    return calls // (lambda a: List.wrap(a.args) // literal_strings)
+
+
+def assigned_tags(node: ast.stmt) -> List[str]:
+    target = (
+        isinstance(node, ast.Assign) and
+        List.wrap(node.targets) / node_name == List('__tags__')
+    )
+    return literal_strings(node.value) if target else List()
+
+
+def first_line(node: ast.stmt) -> int:
+    decorators = List.wrap(getattr(node, 'decorator_list', [])) / _.lineno
+    return min(decorators.cat(node.lineno))
+
+
+def class_entry(node: ast.ClassDef, end: int) -> ClassEntry:
+    doc = Maybe(ast.get_docstring(node, clean=False))
+    body = List.wrap(node.body)
+    functions = body.filter(
+        L(isinstance)(_, (ast.FunctionDef, ast.AsyncFunctionDef)))
+    methods = functions / (lambda a: (a.name, first_line(a)))
+    tags = decorator_tags(node) + (body // assigned_tags)
+    spec_tags = Map(
+        (functions / (lambda a: (a.name, decorator_tags(a))))
+        .filter(lambda a: a[1].length > 0)
+    )
+    return ClassEntry(node.name, first_line(node), end, doc,
+                      doc / doc_specs | List(), methods, tags, spec_tags)
+
+
+def exports(node: ast.stmt) -> Maybe[List[str]]:
+    def names(value: Any) -> Maybe[List[str]]:
+        return (
+            Maybe(List.wrap(value))
+            .filter(lambda a: a.forall(L(isinstance)(_, str)))
+            if isinstance(value, (tuple, list)) else
+            Empty()
+        )
+    target = (
+        isinstance(node, ast.Assign) and
+        List.wrap(node.targets) / node_name == List('__all__')
+    )
+    return (
+        Try(ast.literal_eval, node.value).to_maybe // names
+        if target else
+        Empty()
+    )
+
+
+def node_imports(node: ast.AST) -> List[Import]:
+    return (
+        List.wrap(node.names) / (lambda a: (0, a.name, ()))
+        if isinstance(node, ast.Import) else
+        List((node.level, node.module or '',
+              tuple(List.wrap(node.names) / _.name)))
+        if isinstance(node, ast.ImportFrom) else
+        List()
+    )
+
+
+def scan_source(source: str
+                ) -> Tuple[List[ClassEntry], Maybe[List[str]], List[Import]]:
+    tree = ast.parse(source)
+    body = List.wrap(tree.body)
+    ends = (
+        (body.drop(1) / (lambda a: first_line(a) - 1))
+        .cat(len(source.splitlines()))
+    )
+    classes = (
+        body.zip(ends)
+        .filter(lambda a: isinstance(a[0], ast.ClassDef))
+        .map2(class_entry)
+    )
+    imports = List.wrap(ast.walk(tree)) // node_imports
+    return classes, (body / exports).join.last, imports
+
+
+class DiscoveryIndex(Logging):
+    default_path = Path('.kallikrein') / 'index.json'
+
+    @staticmethod
+    def load(path: Path=None) -> 'DiscoveryIndex':
+        path = path or DiscoveryIndex.default_path
+        def read() -> dict:
+            with path.open() as f:
+                return json.load(f)
+        data = Try(read).to_maybe.filter(L(isinstance)(_, dict)) | dict()
+        return DiscoveryIndex(path, data)
+
+    def __init__(self, path: Path, data: dict) -> None:
+        self.path = path
+        self.data = data
+        self.entries = dict()  # type: dict
+        self.dirty = False
+
+    def _scan(self, path: Path, stat: os.stat_result
+              ) -> Either[str, FileEntry]:
+        def create(scanned: Tuple[List[ClassEntry], Maybe[List[str]],
+                                  List[Import]]) -> FileEntry:
+            classes, exports, imports = scanned
+            entry = FileEntry(stat.st_mtime, stat.st_size, classes, exports,
+                              imports)
+            self.data[str(path)] = entry.data
+            self.dirty = True
+            return entry
+        return (
+            Try(path.read_text) //
+            L(Try)(scan_source, _) /
+            create
+        ).lmap(lambda e: 'cannot scan {}: {}'.format(path, e.cause))
+
+    def _cached(self, key: str, stat: os.stat_result) -> Maybe[FileEntry]:
+        return (
+            Maybe(self.entries.get(key))
+            .o(lambda: Maybe(self.data.get(key)) //
+               (lambda a: Try(FileEntry.from_data, a).to_maybe))
+        ).filter(L(FileEntry.valid)(_, stat))
+
+    def entry(self, path: Path) -> Either[str, FileEntry]:
+        path = path.absolute()
+        key = str(path)
+        def lookup(stat: os.stat_result) -> Either[str, FileEntry]:
+            entry = (
+                self._cached(key, stat)
+                .to_either(None)
+                .o(lambda: self._scan(path, stat))
+            )
+            entry % L(self.entries.__setitem__)(key, _)
+            return entry
+        return Try(path.stat).lmap(lambda e: str(e.cause)) // lookup
+
+    def invalidate(self, paths: Iterable[str]) -> None:
+        for path in paths:
+            key = os.path.abspath(path)
+            self.entries.pop(key, None)
+            if self.data.pop(key, None) is not None:
+                self.dirty = True
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def save(self) -> None:
+        if self.dirty:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open('w') as f:
+                    json.dump(self.data, f)
+                self.dirty = False
+            except OSError as e:
+                msg = 'could not write discovery index: {}'
+                self.log.warning(msg.format(e))
+
+
+discovery_index = None  # type: DiscoveryIndex
+
+
+def index() -> DiscoveryIndex:
+    global discovery_index
+    if discovery_index is None:
+        discovery_index = DiscoveryIndex.load()
+    return discovery_index
+
+__all__ = ('DiscoveryIndex', 'FileEntry', 'ClassEntry', 'index', 'spec_regex',
+           'spec_pattern')
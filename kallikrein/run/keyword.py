@@ -0,0 +1,159 @@
+import re
+import abc
+from fnmatch import fnmatchcase
+from typing import Tuple
+
+from amino import List, Either, Try
+
+token_pattern = re.compile(r'\s*(\(|\)|[^\s()]+)')
+glob_chars = frozenset('*?[')
+operators = frozenset(('and', 'or', 'not'))
+
+
+class Keywords:
+    __slots__ = ('names', 'tags')
+
+    def __init__(self, mod: str, cls: str, name: str, text: str,
+                 tags: List[str]) -> None:
+        cls_path = '{}.{}'.format(mod, cls)
+        self.names = tuple(a.lower() for a in (
+            name, text, cls, mod, cls_path, '{}.{}'.format(cls_path, name)))
+        self.tags = tuple(a.lower() for a in tags)
+
+
+class KeywordExpr(abc.ABC):
+
+    @abc.abstractmethod
+    def matches(self, keywords: Keywords) -> bool:
+        ...
+
+
+class Term(KeywordExpr):
+    tag_prefix = 'tag:'
+
+    def __init__(self, word: str) -> None:
+        self.tag = word.startswith(Term.tag_prefix)
+        self.word = (word[len(Term.tag_prefix):] if self.tag else word).lower()
+        self.glob = not glob_chars.isdisjoint(self.word)
+
+    def match_word(self, candidate: str) -> bool:
+        return (
+            fnmatchcase(candidate, self.word)
+            if self.glob or self.tag else
+            self.word in candidate
+        )
+
+    def matches(self, keywords: Keywords) -> bool:
+        candidates = keywords.tags if self.tag else keywords.names
+        return any(self.match_word(a) for a in candidates)
+
+    def __str__(self) -> str:
+        return 'tag:{}'.format(self.word) if self.tag else self.word
+
+
+class Not(KeywordExpr):
+
+    def __init__(self, expr: KeywordExpr) -> None:
+        self.expr = expr
+
+    def matches(self, keywords: Keywords) -> bool:
+        return not self.expr.matches(keywords)
+
+    def __str__(self) -> str:
+        return 'not {}'.format(self.expr)
+
+
+class And(KeywordExpr):
+
+    def __init__(self, left: KeywordExpr, right: KeywordExpr) -> None:
+        self.left = left
+        self.right = right
+
+    def matches(self, keywords: Keywords) -> bool:
+        return self.left.matches(keywords) and self.right.matches(keywords)
+
+    def __str__(self) -> str:
+        return '({} and {})'.format(self.left, self.right)
+
+
+class Or(KeywordExpr):
+
+    def __init__(self, left: KeywordExpr, right: KeywordExpr) -> None:
+        self.left = left
+        self.right = right
+
+    def matches(self, keywords: Keywords) -> bool:
+        return self.left.matches(keywords) or self.right.matches(keywords)
+
+    def __str__(self) -> str:
+        return '({} or {})'.format(self.left, self.right)
+
+
+class KeywordError(Exception):
+    pass
+
+
+class KeywordParser:
+
+    def __init__(self, tokens: Tuple[str, ...]) -> None:
+        self.tokens = tokens
+        self.pos = 0
+
+    @property
+    def current(self) -> str:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else ''
+
+    def accept(self, token: str) -> bool:
+        if self.current == token:
+            self.pos += 1
+            return True
+        return False
+
+    def parse(self) -> KeywordExpr:
+        expr = self.disjunction()
+        if self.current:
+            raise KeywordError('unexpected `{}`'.format(self.current))
+        return expr
+
+    def disjunction(self) -> KeywordExpr:
+        expr = self.conjunction()
+        while self.accept('or'):
+            expr = Or(expr, self.conjunction())
+        return expr
+
+    def conjunction(self) -> KeywordExpr:
+        expr = self.negation()
+        while self.accept('and'):
+            expr = And(expr, self.negation())
+        return expr
+
+    def negation(self) -> KeywordExpr:
+        return Not(self.negation()) if self.accept('not') else self.atom()
+
+    def atom(self) -> KeywordExpr:
+        token = self.current
+        if self.accept('('):
+            expr = self.disjunction()
+            if not self.accept(')'):
+                raise KeywordError('missing `)`')
+            return expr
+        if not token:
+            raise KeywordError('unexpected end of expression')
+        if token == ')' or token in operators:
+            raise KeywordError('unexpected `{}`'.format(token))
+        self.pos += 1
+        return Term(token)
+
+
+def tokenize(expr: str) -> Tuple[str, ...]:
+    return tuple(token_pattern.findall(expr))
+
+
+def parse_keyword(expr: str) -> Either[str, KeywordExpr]:
+    err = 'invalid keyword expression `{}`: {}'
+    return (
+        Try(lambda: KeywordParser(tokenize(expr)).parse())
+        .lmap(lambda e: err.format(expr, e.cause))
+    )
+
+__all__ = ('Keywords', 'KeywordExpr', 'parse_keyword')
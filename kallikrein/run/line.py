@@ -7,10 +7,15 @@ from amino.task import TaskException
 from amino.list import Lists
 
 from amino.logging import Logging
+from amino.lazy import lazy
 
-from kallikrein.util.string import indent, red_cross, green_check, yellow_clock
+from kallikrein.util.string import (indent, red_cross, green_check, yellow_clock,
+                                    blue)
 from kallikrein.expectation import (ExpectationResult, Expectation,
-                                    PendingExpectationResult)
+                                    CompactExpectationResult,
+                                    CachedExpectationResult)
+from kallikrein.run.timing import SpecTiming
+from kallikrein.run.output import output
 
 
 class Line(Logging, abc.ABC):
@@ -34,7 +39,15 @@ class Line(Logging, abc.ABC):
         ...
 
     def print_report(self) -> None:
-        self.output_lines % self.log.info
+        output().write(self.output_lines)
+
+    @property
+    def failed(self) -> bool:
+        return False
+
+    @property
+    def compact(self) -> 'Line':
+        return self
 
 
 class SimpleLine(Line):
@@ -49,14 +62,20 @@ class PlainLine(SimpleLine):
     def output_lines(self) -> List[str]:
         return List(self.text)
 
+    @property
+    def data(self) -> dict:
+        return dict(kind='plain', text=self.text)
+
 
 class ResultLine(SimpleLine):
 
-    def __init__(self, text: str, spec: Any, result: ExpectationResult, duration: timedelta) -> None:
+    def __init__(self, text: str, spec: Any, result: ExpectationResult, duration: timedelta,
+                 timing: SpecTiming=None) -> None:
         super().__init__(text)
         self.spec = spec
         self.result = result
         self.duration = duration
+        self.timing = timing or SpecTiming()
 
     @property
     def success(self) -> Boolean:
@@ -68,18 +87,68 @@ class ResultLine(SimpleLine):
             green_check
             if self.success else
             yellow_clock
-            if isinstance(self.result, PendingExpectationResult) else
+            if self.result.pending else
             red_cross
         )
 
     @property
+    def failed(self) -> bool:
+        return not (self.success or self.result.pending)
+
+    @lazy
     def output_lines(self) -> List[str]:
         rest = self.result.report_lines if self.result.failure else List()
-        return indent(indent(rest).cons('{} {}'.format(self.sign, self.text)))
+        cached = ' {}'.format(blue('(cached)')) if self.result.cached else ''
+        head = '{} {}{}'.format(self.sign, self.text, cached)
+        return indent(indent(rest).cons(head))
 
     def __str__(self) -> str:
         return '{}({})'.format(self.__class__.__name__, self.output_lines)
 
+    @property
+    def compact(self) -> Line:
+        return ResultLine(self.text, None, self.result.compact, self.duration,
+                          self.timing)
+
+    def timed(self, timing: SpecTiming) -> 'ResultLine':
+        return ResultLine(self.text, self.spec, self.result, self.duration,
+                          self.timing + timing)
+
+    @property
+    def data(self) -> dict:
+        result = self.result
+        report = result.report_lines if result.failure else List()
+        return dict(kind='result', text=self.text,
+                    success=bool(result.success),
+                    pending=bool(result.pending), cached=bool(result.cached),
+                    report=list(report),
+                    duration=self.duration.total_seconds(),
+                    timing=list(self.timing.values))
+
+    @staticmethod
+    def from_data(data: dict) -> 'ResultLine':
+        result = (
+            CachedExpectationResult()
+            if data['cached'] else
+            CompactExpectationResult(data['success'],
+                                     List.wrap(data['report']),
+                                     data['pending'])
+        )
+        return ResultLine(data['text'], None, result,
+                          timedelta(seconds=data['duration']),
+                          SpecTiming(*data['timing']))
+
+
+class SkippedLine(SimpleLine):
+
+    @property
+    def output_lines(self) -> List[str]:
+        return List()
+
+    @property
+    def data(self) -> dict:
+        return dict(kind='skipped', text=self.text)
+
 
 class SpecLine(Line):
 
@@ -109,6 +178,22 @@ class SpecLine(Line):
         return self.name != name
 
 
+class DeferredSpecLine(SpecLine):
+
+    def __init__(self, name: str, text: str, location: Any) -> None:
+        Line.__init__(self, text)
+        self.name = name
+        self.location = location
+
+    @property
+    def spec(self) -> Callable[[Any], Expectation]:  # type: ignore
+        return getattr(self.location.cls.get_or_raise, self.name)
+
+    def __str__(self) -> str:
+        return '{}({}, {}.{})'.format(self.__class__.__name__, self.text,
+                                      self.location.cls_name, self.name)
+
+
 class FatalLine(SimpleLine):
     header = 'error during spec run:'
 
@@ -116,10 +201,39 @@ class FatalLine(SimpleLine):
         self.error = error
 
     @property
-    def output_lines(self) -> List[str]:
+    def message(self) -> Any:
         e = self.error
-        msg = e.cause if isinstance(e, TaskException) else e  # type: ignore
-        return Lists.lines(str(msg)).cons(FatalLine.header)
+        return e.cause if isinstance(e, TaskException) else e  # type: ignore
+
+    @property
+    def output_lines(self) -> List[str]:
+        return Lists.lines(str(self.message)).cons(FatalLine.header)
+
+    @property
+    def failed(self) -> bool:
+        return True
+
+    @property
+    def compact(self) -> Line:
+        return FatalLine(Exception(str(self.message)))
+
+    @property
+    def data(self) -> dict:
+        return dict(kind='fatal', message=str(self.message))
+
+
+def line_from_data(data: dict) -> Line:
+    kind = data['kind']
+    return (
+        PlainLine(data['text'])
+        if kind == 'plain' else
+        ResultLine.from_data(data)
+        if kind == 'result' else
+        SkippedLine(data['text'])
+        if kind == 'skipped' else
+        FatalLine(Exception(data['message']))
+    )
 
 
-__all__ = ('Line', 'PlainLine', 'SpecLine', 'ResultLine', 'FatalLine')
+__all__ = ('Line', 'PlainLine', 'SpecLine', 'ResultLine', 'FatalLine',
+           'SkippedLine', 'DeferredSpecLine', 'line_from_data')
@@ -1,47 +1,90 @@
+import os
+import importlib
 from types import ModuleType
+from typing import Iterable
+from concurrent.futures import ThreadPoolExecutor
 import pkgutil
 from pkgutil import ModuleInfo  # type: ignore
 
 from amino.regex import Regex, Match
-from amino import Path, Either, List, _, Just, Empty, L, Left, __
+from amino import (Path, Either, List, _, Empty, L, Left, __, Right, Maybe,
+                   Try, Just)
 from amino.util.numeric import parse_int
 from amino.list import Lists
 
 from kallikrein.run.data import (SpecLocation, LineSelector,
                                  FileMethodSelector, FileClassSelector,
                                  FileSelector, ModuleSelector)
+from kallikrein.run.index import index, FileEntry, ClassEntry
+from kallikrein.run.trace import tracer
 
 dir_loc_regex = None
 file_loc_regex = Regex(
     r'(?P<path>.*?\.py)(:((?P<lnum>\d+)|(?P<select>\w+(\.\w+)?)))?$')
 path_loc_regex = Regex(r'(?P<path>\w+(\.\w+)*)')
-cls_def_regex = Regex(r'\s*(?P<kw>class|def) (?P<name>\w+)')
-cls_regex = Regex(r'class (?P<name>\w+)')
 init_name = '__init__.py'
+import_threads = 8
+import_class = '<module>'
+import_spec = 'import_module'
+DeadlockError = getattr(importlib._bootstrap,  # type: ignore
+                        '_DeadlockError', RuntimeError)
+
+
+class PackageRoots:
+
+    def __init__(self) -> None:
+        self.packages = dict()  # type: dict
+
+    def package(self, directory: str) -> List[str]:
+        if directory not in self.packages:
+            parent, name = os.path.split(directory)
+            self.packages[directory] = (
+                self.package(parent).cat(name)
+                if name and os.path.isfile(os.path.join(directory, init_name))
+                else List()
+            )
+        return self.packages[directory]
+
+    def resolve(self, path: Path) -> str:
+        directory = os.path.dirname(os.path.abspath(str(path)))
+        return self.package(directory).cat(path.stem).mk_string('.')
+
+    def invalidate(self, paths: Iterable[str]) -> None:
+        def moved(directory: str) -> bool:
+            exists = os.path.isfile(os.path.join(directory, init_name))
+            return (directory in self.packages and
+                    bool(self.packages[directory]) != exists)
+        dirs = set(os.path.dirname(os.path.abspath(a)) for a in paths
+                   if os.path.basename(a) == init_name)
+        stale = tuple(os.path.join(a, '') for a in dirs if moved(a))
+        for directory in list(self.packages):
+            if os.path.join(directory, '').startswith(stale):
+                del self.packages[directory]
+
+    def clear(self) -> None:
+        self.packages.clear()
+
+
+package_roots = PackageRoots()
 
 
 def resolve_module(path: Path) -> str:
-    def rec(p: Path) -> List[str]:
-        return (
-            rec(p.parent).cat(p.name)
-            if List.wrap(p.iterdir()).exists(_.name == init_name) else
-            List()
-        )
-    return rec(path.parent).cat(path.stem).mk_string('.')
+    return package_roots.resolve(path)
+
+
+def file_entry(path: Path) -> Either[str, FileEntry]:
+    return index().entry(path)
 
 
 def lookup_file(loc: str) -> Either[str, List[SpecLocation]]:
     path = Path(loc)
-    mod = resolve_module(path)
     selector = FileSelector(path)
+    def create(entry: FileEntry) -> List[SpecLocation]:
+        mod = resolve_module(path)
+        return entry.classes / L(SpecLocation.deferred)(mod, _, Empty(),
+                                                        selector, True)
     return (
-        (
-            List.lines(path.read_text()) //
-            cls_regex.match //
-            __.group('name')
-        )
-        .traverse(
-            L(SpecLocation.create)(mod, _, Empty(), selector, True), Either)
+        file_entry(path) / create
         if path.is_file() else
         Left('invalid path: {}'.format(loc))
     )
@@ -49,20 +92,15 @@ def lookup_file(loc: str) -> Either[str, List[SpecLocation]]:
 
 def lookup_file_lnum(path: Path, mod: str, lnum: int
                      ) -> Either[str, SpecLocation]:
-    content = List.lines(path.read_text())[:lnum + 1].reversed
     selector = LineSelector(path, lnum)
-    def found_def(name: str) -> Either[str, SpecLocation]:
-        cls = content.find_map(cls_regex.match) // __.group('name')
-        return cls // L(SpecLocation.create)(mod, _, Just(name), selector)
-    def found_cls_def(match: Match) -> Either[str, SpecLocation]:
-        name = match.group('name')
-        return (
-            name // found_def
-            if match.group('kw').contains('def') else
-            name // L(SpecLocation.create)(mod, _, Empty(), selector)
-        )
-    loc = content.find_map(cls_def_regex.match)
-    return loc // found_cls_def
+    line = lnum + 1
+    def create(cls: ClassEntry) -> SpecLocation:
+        return SpecLocation.deferred(mod, cls, cls.method_at(line), selector)
+    return (
+        file_entry(path) //
+        (lambda e: e.class_at(line).to_either('no class at {}'.format(line))) /
+        create
+    )
 
 
 def lookup_file_select(fpath: Path, mod: str, select: str
@@ -75,7 +113,13 @@ def lookup_file_select(fpath: Path, mod: str, select: str
             L(FileMethodSelector)(fpath, cls, _) |
             FileClassSelector(fpath, cls)
         )
-        return SpecLocation.create(mod, cls, meth, selector)
+        return (
+            file_entry(fpath).to_maybe //
+            __.cls(cls) /
+            L(SpecLocation.deferred)(mod, _, meth, selector) /
+            Right |
+            (lambda: SpecLocation.create(mod, cls, meth, selector))
+        )
     return (
         parts.head.to_either('empty select') //
         create /
@@ -100,11 +144,14 @@ def handle_file_lnum(match: Match, mod: str, fpath: Path
 
 
 def handle_file(match: Match, fpath: Path) -> Either[str, List[SpecLocation]]:
-    mod = resolve_module(fpath)
+    def handle(mod: str) -> Either[str, List[SpecLocation]]:
+        return (
+            handle_file_select(match, mod, fpath)
+            .o(lambda: handle_file_lnum(match, mod, fpath))
+            .o(lambda: lookup_file(fpath))
+        )
     return (
-        handle_file_select(match, mod, fpath)
-        .o(lambda: handle_file_lnum(match, mod, fpath))
-        .o(lambda: lookup_file(fpath))
+        file_entry(fpath) / (lambda a: resolve_module(fpath)) // handle
         if fpath.is_file() else
         handle_dir(fpath)
         if fpath.is_dir() else
@@ -122,16 +169,62 @@ def exclude_module(mod: ModuleInfo) -> bool:
     return mod.ispkg or '._' in mod.name
 
 
+def lookup_module_static(info: ModuleInfo) -> Maybe[List[SpecLocation]]:
+    name = info.name
+    fpath = Path(info.module_finder.path) / '{}.py'.format(name.split('.')[-1])
+    selector = ModuleSelector(name)
+    return (
+        file_entry(fpath).to_maybe //
+        _.exported_classes /
+        __.map(L(SpecLocation.deferred)(name, _, Empty(), selector))
+    )
+
+
+def import_module(name: str) -> Either[Exception, ModuleType]:
+    with tracer.span('import', 'import', module=name):
+        return Try(importlib.import_module, name)
+
+
+def deadlocked(result: Either[Exception, ModuleType]) -> bool:
+    return result.swap.exists(lambda e: isinstance(e.cause, DeadlockError))
+
+
+def import_modules(names: List[str]
+                   ) -> List[Either[Exception, ModuleType]]:
+    if names.length < 2:
+        return names / import_module
+    with ThreadPoolExecutor(min(import_threads, names.length)) as executor:
+        results = List.wrap(executor.map(import_module, names))
+    return names.zip(results).map2(
+        lambda a, b: import_module(a) if deadlocked(b) else b)
+
+
+def broken_module(name: str) -> SpecLocation:
+    doc = '{}\nimport ${}'.format(name, import_spec)
+    entry = ClassEntry(import_class, 0, 0, Just(doc), List(import_spec),
+                       List((import_spec, 0)))
+    return SpecLocation.deferred(name, entry, Empty(), ModuleSelector(name))
+
+
 def lookup_package(mod: ModuleType) -> List[SpecLocation]:
     name = mod.__name__
     path = mod.__path__  # type: ignore
-    return (
-        List.wrap(pkgutil.walk_packages(path, prefix='{}.'.format(name)))
-        .filter_not(exclude_module) /
-        _.name //
-        Either.import_module //
-        lookup_path
+    failed = []  # type: list
+    infos = (
+        List.wrap(pkgutil.walk_packages(path, prefix='{}.'.format(name),
+                                        onerror=failed.append))
+        .filter_not(exclude_module)
     )
+    static = infos.zip(infos / lookup_module_static)
+    dynamic = static.filter(lambda a: a[1].is_empty) / (lambda a: a[0].name)
+    modules = dict(dynamic.zip(import_modules(dynamic)))
+    def locations(info: ModuleInfo, locs: Maybe[List[SpecLocation]]
+                  ) -> List[SpecLocation]:
+        return locs | (
+            lambda: modules[info.name] / lookup_path |
+            (lambda: List(broken_module(info.name)))
+        )
+    return static.flat_map2(locations) + List.wrap(failed) / broken_module
 
 
 def lookup_path(path: ModuleType) -> List[SpecLocation]:
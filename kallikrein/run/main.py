@@ -1,30 +1,126 @@
-from typing import Any, Callable
-from datetime import datetime
-
-from hues import huestr
+import os
+import time
+import inspect
+import traceback
+import multiprocessing
+from typing import (Any, Callable, Iterable, Iterator, Optional, Set,
+                    Tuple)
+from datetime import timedelta
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                TimeoutError)
+from concurrent.futures.process import BrokenProcessPool
 
 from golgi import Config
 
-from amino import List, Either, Task, Right, curried, L, _, Maybe, __, Try
-from amino.regex import Regex
+from amino import (List, Either, Task, Right, L, _, Maybe, __, Just, Empty,
+                   Try, Map, Path)
 from amino.logging import amino_root_logger
 from amino.task import TaskException
 
 from kallikrein.run.line import (Line, SpecLine, PlainLine, ResultLine,
-                                 FatalLine)
-from kallikrein.run.data import SpecLocation, SpecResult, SpecsResult
+                                 FatalLine, SkippedLine)
+from kallikrein.run.data import (SpecLocation, SpecResult, SpecsResult,
+                                 FailureLimit)
 from kallikrein.run.lookup_loc import lookup_loc
+from kallikrein.run.index import index
+from kallikrein.run.plan import SpecPlan, spec_plans
+from kallikrein.run.keyword import KeywordExpr, parse_keyword
+from kallikrein.run.history import (DurationHistory, location_key,
+                                    longest_first)
+from kallikrein.run.shard import (Shard, ShardResult, merge_shard_results,
+                                  read_shard_history)
+from kallikrein.run.watch import Watch, watcher
+from kallikrein.run.report import Reporter, JUnitReporter, JsonLinesReporter
+from kallikrein.run.output import flush_output
 from kallikrein.expectation import (Expectation, unsafe_expectation_result,
                                     ExpectationResult, FailedUnsafeSpec,
-                                    FatalSpec)
+                                    FatalSpec, FatalSpecResult,
+                                    TimeoutSpecResult, CachedExpectationResult)
 from kallikrein.expectable import ExpectationFailed
+from kallikrein.util.loop import run_async
+from kallikrein.util.string import bold_red
+from kallikrein.util.watchdog import watchdog
+from kallikrein.run.timing import PhaseTimer, SpecTiming, clock_ns
+from kallikrein.run.trace import tracer, phase_timer
+from kallikrein.run.cache import ResultCache
+
+
+def default_threads() -> int:
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class ClassFixture:
+
+    def __init__(self, cls: type, limit: FailureLimit) -> None:
+        self.cls = cls
+        self.limit = limit
+        self.setup_result = None  # type: Either[TaskException, Any]
+
+    @property
+    def setup(self) -> Either[TaskException, Any]:
+        if self.setup_result is None:
+            self.setup_result = (
+                Maybe.getattr(self.cls, 'setup_class') / Try | Right(None)
+            )
+        return self.setup_result
+
+    @property
+    def skip(self) -> bool:
+        return self.setup_result is None and self.limit.reached
+
+    def teardown(self) -> None:
+        if self.setup_result is not None and self.setup_result.is_right:
+            Maybe.getattr(self.cls, 'teardown_class') % (lambda f: f())
+
+    def setup_error(self, line: SpecLine, error: TaskException) -> Line:
+        result = FatalSpecResult('setup_class', error.cause)
+        return ResultLine(line.text, None, result, timedelta())
+
+    def run(self, line: SpecLine, task: Task[Line], last: bool) -> Line:
+        timer = phase_timer(self.cls.__name__)
+        try:
+            result = (
+                task.run()
+                if self.skip else
+                timer.measure('setup_class', lambda: self.setup)
+                .cata(L(self.setup_error)(line, _), lambda a: task.run())
+            )
+        finally:
+            if last:
+                timer.measure('teardown_class', self.teardown)
+        return (
+            result.timed(timer.timing)
+            if isinstance(result, ResultLine) else
+            result
+        )
 
 
 class SpecRunner:
 
-    def __init__(self, location: SpecLocation, lines: List[Line]) -> None:
+    def __init__(self, location: SpecLocation, lines: List[Line],
+                 limit: FailureLimit=None, timeout: float=0.,
+                 cached: List[str]=List(), durations: Map=Map(),
+                 specs: List[str]=List()) -> None:
         self.location = location
         self.lines = lines
+        self.limit = limit or FailureLimit(0)
+        self.timeout = timeout
+        self.cached = cached
+        self.durations = durations
+        self.specs = specs
+
+    def configured(self, limit: FailureLimit=None, timeout: float=0.
+                   ) -> 'SpecRunner':
+        return SpecRunner(self.location, self.lines, limit, timeout,
+                          self.cached, self.durations, self.specs)
+
+    def with_cached(self, cached: List[str]) -> 'SpecRunner':
+        return SpecRunner(self.location, self.lines, self.limit, self.timeout,
+                          cached, self.durations, self.specs)
+
+    def with_durations(self, durations: Map) -> 'SpecRunner':
+        return SpecRunner(self.location, self.lines, self.limit, self.timeout,
+                          self.cached, durations, self.specs)
 
     @property
     def valid_lines(self) -> List[Line]:
@@ -37,7 +133,10 @@ class SpecRunner:
 
     @property
     def spec_cls(self) -> type:
-        return self.location.cls
+        cls = self.location.cls
+        for error in self.location.import_error:
+            raise error
+        return cls.get_or_raise
 
     def _run_line(self, line: Line) -> Task[Line]:
         return (
@@ -48,19 +147,119 @@ class SpecRunner:
             Task.failed('invalid line in spec: {}'.format(line))
         )
 
+    def _run_concurrent(self, lines: List[Line]) -> List[Task[Line]]:
+        futures = dict()  # type: dict
+        def submit() -> None:
+            executor = ThreadPoolExecutor(self.max_threads)
+            specs = longest_first(lines.filter_type(SpecLine),
+                                  lambda a: self.durations.lift(a.name))
+            for line in specs:
+                futures[line] = executor.submit(self.run_spec(line).run)
+            executor.shutdown(wait=False)
+        def result(line: SpecLine) -> Line:
+            if not futures:
+                submit()
+            return futures[line].result()
+        def run(line: Line) -> Task[Line]:
+            return (
+                Task.delay(result, line)
+                if isinstance(line, SpecLine) else
+                self._run_line(line)
+            )
+        return lines / run
+
+    def _with_class_fixture(self, lines: List[Line], tasks: List[Task[Line]]
+                            ) -> List[Task[Line]]:
+        fixture = ClassFixture(self.spec_cls, self.limit)
+        runnable = lines.filter_type(SpecLine).filter_not(self.is_cached)
+        last = runnable.last
+        def wrap(line: Line, task: Task[Line]) -> Task[Line]:
+            return (
+                Task.delay(fixture.run, line, task, last.contains(line))
+                if line in runnable else
+                task
+            )
+        return lines.zip(tasks).map2(wrap)
+
     @property
     def run(self) -> Task[List[Line]]:
-        return self.valid_lines.traverse(self._run_line, Task)
+        return self.run_lazy.sequence(Task)
+
+    def _import_error(self, error: TaskException) -> List[Task[Line]]:
+        def fail(line: Line) -> Line:
+            return (
+                ResultLine(line.text, None,
+                           FatalSpecResult('<module>', error.cause),
+                           timedelta())
+                if isinstance(line, SpecLine) else
+                line
+            )
+        return self.valid_lines / fail / Task.now
 
     @property
     def run_lazy(self) -> List[Task[Line]]:
-        return self.valid_lines / self._run_line
+        return (
+            Try(lambda: self.spec_cls)
+            .cata(self._import_error, lambda a: self._run_lazy)
+        )
+
+    @property
+    def _run_lazy(self) -> List[Task[Line]]:
+        lines = self.valid_lines
+        tasks = (
+            self._run_concurrent(lines)
+            if self.concurrent else
+            lines / self._run_line
+        )
+        return (
+            self._with_class_fixture(lines, tasks)
+            if self.class_fixture else
+            tasks
+        )
 
     @property
     def unsafe(self) -> bool:
         return hasattr(self.spec_cls, '__unsafe__')
 
-    def run_spec(self, line: SpecLine) -> Task[ResultLine]:
+    @property
+    def class_fixture(self) -> bool:
+        return (hasattr(self.spec_cls, 'setup_class') or
+                hasattr(self.spec_cls, 'teardown_class'))
+
+    @property
+    def concurrent(self) -> bool:
+        return hasattr(self.spec_cls, '__concurrent__')
+
+    @property
+    def max_threads(self) -> Optional[int]:
+        threads = getattr(self.spec_cls, '__concurrent__', None)
+        return default_threads() if threads is True else threads
+
+    @property
+    def spec_lines(self) -> List[SpecLine]:
+        return self.valid_lines.filter_type(SpecLine)
+
+    def is_cached(self, line: SpecLine) -> bool:
+        return line.name in self.cached
+
+    def spec_timeout(self, line: SpecLine) -> Maybe[float]:
+        return (
+            Maybe.getattr(line.spec, '__timeout__')
+            .o(lambda: Maybe.getattr(self.spec_cls, '__timeout__'))
+            .o(Just(self.timeout))
+            .filter(_ > 0)
+        )
+
+    @property
+    def timeout_budget(self) -> Maybe[float]:
+        timeouts = self.spec_lines / self.spec_timeout
+        return (
+            Just(sum(timeouts.join))
+            if timeouts.forall(_.is_just) else
+            Empty()
+        )
+
+    def run_spec(self, line: SpecLine) -> Task[Line]:
         def recover(error: TaskException) -> Expectation:
             cause = error.cause
             return (
@@ -68,9 +267,12 @@ class SpecRunner:
                 if isinstance(cause, ExpectationFailed) else
                 FatalSpec(line.name, cause)
             )
+        def call(spec: Callable[[Any], Expectation], inst: Any) -> Expectation:
+            result = spec(inst)
+            return run_async(result) if inspect.isawaitable(result) else result
         def execute(spec: Callable[[Any], Expectation],
                     inst: Any) -> Task[Expectation]:
-            return Try(spec, inst).right_or_map(recover)
+            return Try(call, spec, inst).right_or_map(recover)
         def evaluate(expectation: Expectation) -> Task[ExpectationResult]:
             err = 'spec "{}" did not return an Expectation, but `{}`'
             return (
@@ -79,90 +281,286 @@ class SpecRunner:
                 Task.now(unsafe_expectation_result)
                 if self.unsafe else
                 Task.failed(err.format(line.text, expectation)))
-        def run(inst: Any) -> Task[ResultLine]:
+        def run(timer: PhaseTimer, inst: Any) -> Task[ResultLine]:
+            def measure_evaluate(expectation: Expectation
+                                 ) -> Task[ExpectationResult]:
+                return Task.delay(timer.measure, 'evaluate',
+                                  lambda: evaluate(expectation).run())
             def teardown(a: ExpectationResult) -> None:
                 if hasattr(inst, 'teardown'):
-                    inst.teardown()
+                    timer.measure('teardown', inst.teardown)
             if hasattr(inst, 'setup'):
-                inst.setup()
-            start = datetime.now()
+                timer.measure('setup', inst.setup)
             def result(r: ExpectationResult) -> ResultLine:
-                return ResultLine(line.text, inst, r, datetime.now() - start)
+                timing = timer.timing
+                return ResultLine(line.text, inst, r, timing.duration, timing)
             return (
-                Task.delay(execute, line.spec, inst) //
-                evaluate %
+                Task.delay(timer.measure, 'spec', execute, line.spec, inst) //
+                measure_evaluate %
                 teardown /
                 result
             )
-        return Task.delay(self.spec_cls) // run
+        def spec() -> Task[Line]:
+            timer = phase_timer(line.name)
+            return (
+                Task.delay(timer.measure, 'instantiate', self.spec_cls) //
+                L(run)(timer, _)
+            )
+        def timed_out(seconds: float, stack: List[traceback.FrameSummary]) -> Line:
+            frames = stack.drop_while(_.name != line.name) or stack
+            trace = List.lines(''.join(traceback.format_list(frames)))
+            result = TimeoutSpecResult(line.name, seconds,
+                                       trace / __.rstrip())
+            timing = SpecTiming.seconds(seconds)
+            return ResultLine(line.text, None, result, timing.duration, timing)
+        def guarded(seconds: float) -> Line:
+            return (
+                watchdog(lambda: spec().run(), seconds)
+                .right_or_map(L(timed_out)(seconds, _))
+            )
+        def start() -> Task[Line]:
+            return (
+                Task.now(ResultLine(line.text, None, CachedExpectationResult(),
+                                    timedelta()))
+                if self.is_cached(line) else
+                Task.now(SkippedLine(line.text))
+                if self.limit.reached else
+                self.spec_timeout(line) /
+                L(Task.delay)(guarded, _) |
+                spec
+            )
+        return Task.suspend(start)
 
     def __str__(self) -> str:
-        return '{}({}, {})'.format(self.__class__.__name__, self.spec_cls, self.lines)
+        return '{}({}, {})'.format(self.__class__.__name__,
+                                   self.location.cls_name, self.lines)
 
 
 def parse_locator(loc: str) -> Either[str, List[SpecLocation]]:
-    return lookup_loc(loc)
+    with tracer.span('lookup', 'discovery', locator=loc):
+        return lookup_loc(loc)
 
 
 def collect_specs(specs: List[str]) -> Either[str, List[SpecLocation]]:
-    return specs.traverse(parse_locator, Either) / _.join
+    result = specs.traverse(parse_locator, Either) / _.join
+    with tracer.span('save index', 'discovery'):
+        index().save()
+    return result
 
 
-def spec_line(spec: SpecLocation, attr: str, line: str) -> Maybe[SpecLine]:
-    err = 'spec class `{}` does not define a spec `{}`'
-    return (
-        Maybe.getattr(spec.cls, attr)
-        .to_either(err.format(spec.cls, attr))
-        .map(L(SpecLine)(attr, line, _))
-    )
+def construct_runner(loc: SpecLocation,
+                     keyword: Maybe[KeywordExpr]=Empty()
+                     ) -> Either[str, SpecRunner]:
+    with tracer.span('plan', 'discovery', cls=loc.cls_name):
+        doc = (
+            loc.doc.o(lambda: loc.cls / (lambda a: ''))
+            if loc.allow_empty else
+            loc.doc
+        )
+        def runner(plan: SpecPlan) -> SpecRunner:
+            selected = keyword / L(plan.select)(loc, _) | plan
+            return SpecRunner(loc, selected.lines(loc),
+                              specs=plan.spec_names)
+        return doc // L(spec_plans.plan)(loc, _) / runner
 
 
-spec_regex = r'\s*(?P<text>[^#\s][^\$]+)\$(?P<spec>\w+)'
+def construct_runners(specs: List[SpecLocation],
+                      keyword: Maybe[KeywordExpr]=Empty()
+                      ) -> Either[str, List[SpecRunner]]:
+    result = specs.traverse(L(construct_runner)(_, keyword), Either)
+    return keyword.cata(lambda k: result / __.filter(_.spec_lines), result)
 
 
-@curried
-def parse_line(spec: Any, line: str) -> Line:
-    match = Regex(spec_regex).match(line)
-    match_data = lambda m: m.group('spec') & m.group('text')
-    return (
-        (match // match_data)
-        .map2(L(spec_line)(spec, _, _)) |
-        Right(PlainLine(line))
-    )
+def run_spec_class(runner: SpecRunner) -> Task[List[SpecResult]]:
+    return runner.run / L(SpecResult)(_, location_key(runner.location))
 
 
-def construct_runner(loc: SpecLocation) -> Either[str, SpecRunner]:
-    doc = loc.doc.o(Right('')) if loc.allow_empty else loc.doc
-    return (
-        doc /
-        List.lines //
-        __.traverse(parse_line(loc), Either) /
-        L(SpecRunner)(loc, _)
-    )
+def run_specs(runners: List[SpecRunner]) -> Task[SpecsResult]:
+    return runners.traverse(run_spec_class, Task) / SpecsResult
 
 
-def construct_runners(specs: List[SpecLocation]
-                      ) -> Either[str, List[SpecRunner]]:
-    return specs.traverse(construct_runner, Either)
+def run_specs_lazy(runners: List[SpecRunner], limit: FailureLimit=None,
+                   timeout: float=0.) -> Iterator[List[Task[Line]]]:
+    return (runner.configured(limit, timeout).run_lazy for runner in runners)
 
 
-def run_spec_class(runner: SpecRunner) -> Task[List[SpecResult]]:
-    return runner.run / SpecResult
+def force_line(spec: Task[Line]) -> Line:
+    return spec.attempt.right_or_map(FatalLine)
 
 
-def run_specs(runners: List[SpecRunner]) -> Task[SpecsResult]:
-    return runners.traverse(run_spec_class, Task) / SpecsResult
+def run_location_compact(loc: SpecLocation, timeout: float=0.,
+                         cached: tuple=(), durations: tuple=()) -> List[Line]:
+    def run(runner: SpecRunner) -> List[Line]:
+        lines = (
+            runner.with_cached(List.wrap(cached))
+            .with_durations(Map(dict(durations)))
+            .configured(timeout=timeout)
+            .run_lazy
+        )
+        with tracer.span('run', 'runner', cls=loc.cls_name):
+            return lines / force_line / _.compact
+    return construct_runner(loc).cata(lambda e: List(FatalLine(Exception(e))),
+                                      run)
 
 
-def run_specs_lazy(runners: List[SpecRunner]
-                   ) -> List[List[Task[Line]]]:
-    return runners.map(_.run_lazy)
+def run_location_traced(loc: SpecLocation, timeout: float=0.,
+                        cached: tuple=(), durations: tuple=()
+                        ) -> Tuple[List[Line], list]:
+    tracer.start('worker {}'.format(os.getpid()))
+    lines = run_location_compact(loc, timeout, cached, durations)
+    return lines, tracer.drain()
 
 
-def runners(specs: List[str]) -> Either[str, List[SpecRunner]]:
+def location_budget(loc: SpecLocation, timeout: float) -> Optional[float]:
+    def budget(runner: SpecRunner) -> Maybe[float]:
+        return runner.configured(timeout=timeout).timeout_budget
+    return (
+        construct_runner(loc).to_maybe //
+        (lambda a: Try(budget, a).to_maybe // (lambda b: b))
+    ) | None
+
+
+def run_location_worker(started: Any, token: int, trace: bool,
+                        loc: SpecLocation, timeout: float, *args: Any) -> Any:
+    start = time.time()
+    started[token] = start, None
+    started[token] = start, location_budget(loc, timeout)
+    run = run_location_traced if trace else run_location_compact
+    return run(loc, timeout, *args)
+
+
+def skip_runner(runner: SpecRunner) -> List[Line]:
+    return runner.spec_lines / _.text / SkippedLine
+
+
+class BudgetExceeded(Exception):
+
+    def __init__(self, seconds: float) -> None:
+        super().__init__(seconds)
+        self.seconds = seconds
+
+
+class WorkerPool:
+    killed_msg = 'the worker process was killed'
+    grace = 10.
+    poll = .1
+
+    def __init__(self, jobs: int, timeout: float) -> None:
+        self.jobs = jobs
+        self.timeout = timeout
+        self.executor = ProcessPoolExecutor(jobs)
+        self.manager = multiprocessing.Manager()
+        self.started = self.manager.dict()
+        self.generation = 0
+        self.tokens = 0
+        self.futures = dict()  # type: dict
+
+    def submit(self, runner: SpecRunner) -> None:
+        self.tokens += 1
+        future = self.executor.submit(run_location_worker, self.started,
+                                      self.tokens, tracer.enabled,
+                                      runner.location, self.timeout,
+                                      tuple(runner.cached),
+                                      tuple(runner.durations.items()))
+        self.futures[runner] = future, self.generation, self.tokens
+
+    def replace(self) -> None:
+        for process in list(self.executor._processes.values()):  # type: ignore
+            process.terminate()
+        self.executor.shutdown(wait=False)
+        self.executor = ProcessPoolExecutor(self.jobs)
+        self.generation += 1
+
+    def shutdown(self) -> None:
+        self.executor.shutdown()
+        self.manager.shutdown()
+
+    def killed(self, runner: SpecRunner, seconds: float) -> List[Line]:
+        def timed_out(line: SpecLine) -> Line:
+            result = TimeoutSpecResult(line.name, seconds,
+                                       List(WorkerPool.killed_msg))
+            timing = SpecTiming.seconds(seconds)
+            return ResultLine(line.text, None, result, timing.duration, timing)
+        return runner.spec_lines / timed_out
+
+    def wait(self, future: Any, token: int, budget: Optional[float]) -> Any:
+        while True:
+            start, reported = self.started.get(token, (None, None))
+            limit = budget if reported is None else reported + self.grace
+            remaining = (
+                WorkerPool.poll
+                if start is None or limit is None else
+                start + limit - time.time()
+            )
+            if remaining <= 0:
+                raise BudgetExceeded(limit)
+            try:
+                return future.result(min(remaining, WorkerPool.poll))
+            except TimeoutError:
+                pass
+
+    def result(self, runner: SpecRunner) -> List[Line]:
+        future, generation, token = self.futures[runner]
+        budget = (
+            runner.configured(timeout=self.timeout).timeout_budget /
+            (_ + self.grace)
+            if runner.location.imported or self.timeout > 0 else
+            Empty()
+        )
+        try:
+            return self.unpack(self.wait(future, token, budget | None))
+        except BudgetExceeded as e:
+            self.replace()
+            return self.killed(runner, e.seconds)
+        except BrokenProcessPool as e:
+            if generation < self.generation:
+                self.submit(runner)
+                return self.result(runner)
+            return List(FatalLine(e))
+        except Exception as e:
+            return List(FatalLine(e))
+
+    def unpack(self, result: Any) -> List[Line]:
+        if tracer.enabled:
+            lines, events = result
+            tracer.extend(events)
+            return lines
+        return result
+
+    def cancel(self, runner: SpecRunner) -> bool:
+        future, generation, token = self.futures[runner]
+        return generation == self.generation and future.cancel()
+
+
+def run_specs_parallel(runners: List[SpecRunner], jobs: int,
+                       limit: FailureLimit=None, timeout: float=0.,
+                       history: DurationHistory=None
+                       ) -> Iterator[List[Task[Line]]]:
+    limit = limit or FailureLimit(0)
+    pool = WorkerPool(jobs, timeout)
+    try:
+        scheduled = (
+            runners
+            if history is None else
+            history.schedule(runners, _.location)
+        )
+        scheduled % pool.submit
+        for runner in runners:
+            lines = (
+                skip_runner(runner)
+                if limit.reached and pool.cancel(runner) else
+                pool.result(runner)
+            )
+            yield lines / Task.now
+    finally:
+        pool.shutdown()
+
+
+def runners(specs: List[str], keyword: Maybe[KeywordExpr]=Empty()
+            ) -> Either[str, List[SpecRunner]]:
     return (
         collect_specs(specs) //
-        construct_runners
+        L(construct_runners)(_, keyword)
     )
 
 
@@ -170,31 +568,157 @@ def specs_run_task(specs: List[str]) -> Task[SpecsResult]:
     return runners(specs).task() // run_specs
 
 
-def specs_run_task_lazy(specs: List[str]) -> Either[str, List[List[Task[Line]]]]:
-    return runners(specs) / run_specs_lazy
+def specs_run_task_lazy(specs: List[str], limit: FailureLimit=None,
+                        timeout: float=0.
+                        ) -> Either[str, Iterator[List[Task[Line]]]]:
+    return runners(specs) / L(run_specs_lazy)(_, limit, timeout)
 
 
-def convert_lazy_result(result: List[List[Line]], log: bool=False) -> SpecsResult:
-    def convert_spec(spec: Task[ExpectationResult]) -> Line:
-        line = spec.attempt.right_or_map(FatalLine)
-        if log:
+def specs_run_parallel(specs: List[str], jobs: int, limit: FailureLimit=None,
+                       timeout: float=0.
+                       ) -> Either[str, Iterator[List[Task[Line]]]]:
+    return runners(specs) / L(run_specs_parallel)(_, jobs, limit, timeout)
+
+
+class LinePrinter:
+
+    def __init__(self, quiet: bool) -> None:
+        self.quiet = quiet
+        self.start_class()
+
+    def start_class(self) -> None:
+        self.title = Empty()  # type: Maybe[Line]
+        self.shown = False
+
+    def print_line(self, line: Line) -> None:
+        if not self.quiet:
+            line.print_report()
+        elif line.failed:
+            if not self.shown:
+                self.title % __.print_report()
+                self.shown = True
             line.print_report()
-        return line
-    def convert_loc(loc: List[Task[ExpectationResult]]) -> SpecsResult:
-        return SpecResult(loc / convert_spec)
-    result = SpecsResult(result / convert_loc)
+        elif self.title.is_empty and isinstance(line, PlainLine) and line.text:
+            self.title = Just(line)
+
+
+def convert_lazy_result(result: Iterable[List[Task[Line]]], log: bool=False,
+                        compact: bool=False, limit: FailureLimit=None,
+                        durations: int=0, reporters: List[Reporter]=List(),
+                        names: List[str]=List(), quiet: bool=False
+                        ) -> SpecsResult:
+    limit = limit or FailureLimit(0)
+    printer = LinePrinter(quiet)
+    def report(line: Line) -> None:
+        for reporter in reporters:
+            reporter.report(line)
+    def convert_line(line: Line) -> Line:
+        with tracer.span('report', 'report', line=line.text):
+            if log:
+                printer.print_line(line)
+            report(line)
+        return line.compact if compact else line
+    def convert_loc(loc: List[Task[Line]], index: int) -> SpecResult:
+        name = class_name(index)
+        with tracer.span('class', 'runner', cls=name):
+            return SpecResult(convert_specs(loc, name),
+                              names.lift(index) | '')
+    def convert_specs(loc: List[Task[Line]], name: str) -> List[Line]:
+        printer.start_class()
+        reporters % __.start_class(name)
+        lines = List()
+        held = List()
+        for spec in loc:
+            line = force_line(spec)
+            limit.record(line)
+            if limit.reached and isinstance(line, PlainLine):
+                held = held.cat(line)
+            elif isinstance(line, SkippedLine):
+                report(line)
+                lines = lines.cat(line)
+            else:
+                lines = lines + (held.cat(line) / convert_line)
+                held = List()
+        reporters % __.end_class()
+        if log:
+            flush_output()
+        return lines
+    def class_name(index: int) -> str:
+        return names.lift(index) | str(index)
+    start = clock_ns()
+    try:
+        specs = List.wrap(convert_loc(loc, i) for i, loc in enumerate(result))
+    finally:
+        reporters % __.finish()
+    result = SpecsResult(specs, clock_ns() - start)
     if log:
-        result.print_stats()
+        with tracer.span('stats', 'report'):
+            result.print_stats()
+            if durations > 0:
+                result.print_durations(durations)
+            flush_output()
     return result
 
 
+def spec_names(runner: SpecRunner) -> Map:
+    return Map(dict(runner.spec_lines / (lambda a: (a.text, a.name))))
+
+
+def use_cache(cache: ResultCache, runner: SpecRunner) -> SpecRunner:
+    return runner.with_cached(cache.passed(runner.location))
+
+
+def update_cache(cache: ResultCache, runners: List[SpecRunner],
+                 result: SpecsResult) -> None:
+    for runner, spec in runners.zip(result.specs):
+        cache.update(runner.location, spec_names(runner), spec.spec_results)
+    cache.save()
+    index().save()
+
+
+def use_history(history: DurationHistory, runner: SpecRunner) -> SpecRunner:
+    names = runner.spec_lines / _.name
+    durations = history.spec_durations(runner.location, names)
+    return runner.with_durations(durations)
+
+
+def update_history(history: DurationHistory, runners: List[SpecRunner],
+                   result: SpecsResult) -> None:
+    for runner, spec in runners.zip(result.specs):
+        history.update(location_key(runner.location), spec,
+                       spec_names(runner), runner.specs)
+    history.save()
+
+
+def select_shard(shard: Shard, runners: List[SpecRunner],
+                 history: DurationHistory) -> List[SpecRunner]:
+    return shard.select(runners, _.location, history)
+
+
+def write_shard_result(shard: Shard, path: str, total: List[str],
+                       runners: List[SpecRunner], result: SpecsResult
+                       ) -> None:
+    target = Path(path) if path else shard.default_result_path
+    keys = runners / _.location / location_key
+    shard_result = ShardResult(str(shard), keys, total, result)
+    Try(shard_result.write, target).leffect(run_error)
+
+
+def file_reporters(junit: str, json_lines: str) -> List[Reporter]:
+    return (
+        List(junit).filter(bool) / Path / JUnitReporter +
+        List(json_lines).filter(bool) / Path / JsonLinesReporter
+    )
+
+
 def run_error(e: Any) -> None:
     msg = e.cause if isinstance(e, TaskException) else e
+    flush_output()
     if Config['general'].debug:
         amino_root_logger.caught_exception('running spec', msg)
     else:
         amino_root_logger.error('error in spec run:')
-        amino_root_logger.error(huestr(str(msg)).red.bold.colorized)
+        amino_root_logger.error(bold_red(msg))
 
 
 def kallikrein_run(specs: List[str]) -> Either[Exception, SpecsResult]:
@@ -205,10 +729,92 @@ def kallikrein_run(specs: List[str]) -> Either[Exception, SpecsResult]:
     )
 
 
-def kallikrein_run_lazy(specs: List[str]) -> Either[Exception, SpecsResult]:
-    return (
-        specs_run_task_lazy(specs) /
-        L(convert_lazy_result)(_, True)
-    ).leffect(run_error)
+def run_lazy(specs: List[str], jobs: int=1, compact: bool=False,
+             max_failures: int=0, timeout: float=0., durations: int=0,
+             incremental: bool=False, keyword: str='', shard: str='',
+             shard_result: str='', shard_history: str='',
+             modules: Set[str]=None, junit: str='', json_lines: str='',
+             quiet: bool=False, trace: str=''
+             ) -> Either[Exception, SpecsResult]:
+    if trace:
+        tracer.start()
+    limit = FailureLimit(max_failures)
+    cache = ResultCache.load() if incremental else None
+    history = DurationHistory.load()
+    def run(selected: Maybe[Shard], total: List[str], rs: List[SpecRunner]
+            ) -> SpecsResult:
+        lazy = (
+            run_specs_parallel(rs, jobs, limit, timeout, history)
+            if jobs > 1 else
+            run_specs_lazy(rs, limit, timeout)
+        )
+        names = rs / _.location / location_key
+        result = convert_lazy_result(lazy, True, compact, limit, durations,
+                                     file_reporters(junit, json_lines), names,
+                                     quiet)
+        if cache is not None:
+            update_cache(cache, rs, result)
+        selected.cata(
+            L(write_shard_result)(_, shard_result, total, rs, result),
+            lambda: update_history(history, rs, result)
+        )
+        return result
+    def start(expr: Maybe[KeywordExpr], selected: Maybe[Shard],
+              partition: DurationHistory) -> Either[str, SpecsResult]:
+        def select(rs: List[SpecRunner]) -> SpecsResult:
+            total = rs / _.location / location_key
+            chosen = selected.cata(L(select_shard)(_, rs, partition), rs)
+            cached = (
+                chosen if cache is None else chosen / L(use_cache)(cache, _))
+            return run(selected, total, cached / L(use_history)(history, _))
+        return (
+            runners(specs, expr) /
+            (lambda rs: rs if modules is None else
+             rs.filter(lambda a: a.location.mod in modules)) /
+            select
+        )
+    expr = parse_keyword(keyword) / Just if keyword else Right(Empty())
+    selected = Shard.parse(shard) / Just if shard else Right(Empty())
+    partition = read_shard_history(shard_history)
+    result = (
+        expr.product2(selected, partition)
+        .flat_map3(start)
+        .leffect(run_error)
+    )
+    if trace:
+        tracer.stop()
+        Try(tracer.write, Path(trace)).leffect(run_error)
+    return result
+
+
+def kallikrein_run_lazy(specs: List[str], **options: Any
+                        ) -> Either[Exception, SpecsResult]:
+    result = run_lazy(specs, **options)
+    spec_plans.clear()
+    return result
+
+
+def kallikrein_watch(specs: List[str], **options: Any
+                     ) -> Either[Exception, SpecsResult]:
+    root = os.getcwd()
+    def run(modules: Optional[Set[str]]) -> Either[Exception, SpecsResult]:
+        return run_lazy(specs, modules=modules, **options)
+    return Watch(root, run).start(watcher(root))
+
+
+def kallikrein_merge(paths: List[str], durations: int=0
+                     ) -> Either[Exception, SpecsResult]:
+    def report(merged: ShardResult) -> SpecsResult:
+        result = merged.result
+        result.print_report()
+        if durations > 0:
+            result.print_durations(durations)
+        flush_output()
+        history = DurationHistory.load()
+        for key, spec in merged.keys.zip(result.specs):
+            history.update(key, spec, Map())
+        history.save()
+        return result
+    return (merge_shard_results(paths) / report).leffect(run_error)
 
 __all__ = ('kallikrein_run',)
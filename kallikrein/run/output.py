@@ -0,0 +1,104 @@
+import abc
+import sys
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, IO, Optional, Iterator
+
+from amino import List
+from amino.logging import Logging
+
+
+class Output(abc.ABC):
+
+    @abc.abstractmethod
+    def write(self, lines: List[str]) -> None:
+        ...
+
+    def flush(self) -> None:
+        pass
+
+
+class LogOutput(Output, Logging):
+
+    def write(self, lines: List[str]) -> None:
+        lines % self.log.info
+
+
+class BufferedOutput(Output):
+    interval = .5
+
+    def __init__(self, stream: IO[str]=None, interval: float=None) -> None:
+        self.stream = stream
+        self.interval = (
+            BufferedOutput.interval
+            if interval is None else
+            interval
+        )
+        self.buffer = []  # type: list
+        self.lock = threading.RLock()
+        self.timer = None  # type: Optional[threading.Timer]
+
+    def write(self, lines: List[str]) -> None:
+        with self.lock:
+            self.buffer.extend(lines)
+            if self.buffer and self.timer is None and self.interval > 0:
+                self.timer = threading.Timer(self.interval, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self) -> None:
+        if not self.buffer:
+            return
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            lines, self.buffer = self.buffer, []
+            if lines:
+                out = self.stream or sys.stdout
+                out.write('\n'.join(lines))
+                out.write('\n')
+                out.flush()
+
+
+current_output = None  # type: Optional[Output]
+
+
+def output() -> Output:
+    global current_output
+    if current_output is None:
+        current_output = BufferedOutput()
+    return current_output
+
+
+def use_output(out: Output) -> None:
+    global current_output
+    flush_output()
+    current_output = out
+
+
+def flush_output() -> None:
+    if current_output is not None:
+        current_output.flush()
+
+
+@contextmanager
+def flushing_logs() -> Iterator[None]:
+    previous = logging.getLogRecordFactory()
+    def record(*a: Any, **kw: Any) -> logging.LogRecord:
+        flush_output()
+        return previous(*a, **kw)
+    logging.setLogRecordFactory(record)
+    try:
+        yield
+    finally:
+        if logging.getLogRecordFactory() is record:
+            logging.setLogRecordFactory(previous)
+        flush_output()
+
+atexit.register(flush_output)
+
+__all__ = ('Output', 'LogOutput', 'BufferedOutput', 'output', 'use_output',
+           'flush_output', 'flushing_logs')
@@ -0,0 +1,112 @@
+from typing import Tuple, Union, Iterable
+
+from amino import List, Either, Right, Left, L, _, __
+
+from kallikrein.run.line import Line, PlainLine, DeferredSpecLine
+from kallikrein.run.data import SpecLocation
+from kallikrein.run.index import spec_pattern
+from kallikrein.run.keyword import Keywords, KeywordExpr
+
+
+class PlainStep:
+    __slots__ = ('text',)
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def line(self, loc: SpecLocation) -> Line:
+        return PlainLine(self.text)
+
+    def selected(self, loc: SpecLocation, expr: KeywordExpr) -> bool:
+        return True
+
+
+class SpecStep:
+    __slots__ = ('name', 'text')
+    undefined_msg = 'spec class `{}` does not define a spec `{}`'
+
+    def __init__(self, name: str, text: str) -> None:
+        self.name = name
+        self.text = text
+
+    def line(self, loc: SpecLocation) -> Line:
+        return DeferredSpecLine(self.name, self.text, loc)
+
+    def selected(self, loc: SpecLocation, expr: KeywordExpr) -> bool:
+        keywords = Keywords(loc.mod, loc.cls_name, self.name, self.text,
+                            loc.tags(self.name))
+        return expr.matches(keywords)
+
+    def check(self, loc: SpecLocation) -> Either[str, 'SpecStep']:
+        err = SpecStep.undefined_msg.format(loc.cls_name, self.name)
+        return (
+            Right(self)
+            if loc.defines(self.name) else
+            loc.cls //
+            (lambda a: Right(self) if hasattr(a, self.name) else Left(err))
+        )
+
+
+Step = Union[PlainStep, SpecStep]
+
+
+def parse_step(line: str) -> Step:
+    match = spec_pattern.match(line)
+    return (
+        PlainStep(line)
+        if match is None else
+        SpecStep(match.group('spec'), match.group('text'))
+    )
+
+
+class SpecPlan:
+    __slots__ = ('steps',)
+
+    def __init__(self, steps: Tuple[Step, ...]) -> None:
+        self.steps = steps
+
+    @staticmethod
+    def compile(loc: SpecLocation, doc: str) -> Either[str, 'SpecPlan']:
+        steps = List.lines(doc) / parse_step
+        return (
+            steps.filter_type(SpecStep).traverse(__.check(loc), Either) /
+            (lambda a: SpecPlan(tuple(steps)))
+        )
+
+    @property
+    def spec_names(self) -> List[str]:
+        return List.wrap(self.steps).filter_type(SpecStep) / _.name
+
+    def select(self, loc: SpecLocation, expr: KeywordExpr) -> 'SpecPlan':
+        return SpecPlan(tuple(a for a in self.steps if a.selected(loc, expr)))
+
+    def lines(self, loc: SpecLocation) -> List[Line]:
+        return List.wrap(self.steps) / __.line(loc)
+
+
+class SpecPlans:
+
+    def __init__(self) -> None:
+        self.plans = dict()  # type: dict
+
+    def plan(self, loc: SpecLocation, doc: str) -> Either[str, SpecPlan]:
+        key = loc.mod, loc.cls_name, doc
+        if key in self.plans:
+            return Right(self.plans[key])
+        plan = SpecPlan.compile(loc, doc)
+        plan % L(self.plans.__setitem__)(key, _)
+        return plan
+
+    def invalidate(self, mods: Iterable[str]) -> None:
+        names = set(mods)
+        for key in list(self.plans):
+            if key[0] in names:
+                del self.plans[key]
+
+    def clear(self) -> None:
+        self.plans.clear()
+
+
+spec_plans = SpecPlans()
+
+__all__ = ('SpecPlan', 'SpecPlans', 'spec_plans')
@@ -0,0 +1,178 @@
+import re
+import abc
+import json
+from typing import IO, Any
+from xml.sax.saxutils import escape, quoteattr
+
+from amino import List, Path
+
+from kallikrein.run.line import Line, ResultLine, SkippedLine, FatalLine
+from kallikrein.util.string import strip_ansi
+
+invalid_xml = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def plain_text(lines: List[str]) -> str:
+    return strip_ansi(lines.join_lines)
+
+
+def status(line: Line) -> str:
+    return (
+        'skipped'
+        if isinstance(line, SkippedLine) else
+        'error'
+        if isinstance(line, FatalLine) else
+        'cached'
+        if line.result.cached else
+        'passed'
+        if line.success else
+        'pending'
+        if line.result.pending else
+        'failed'
+    )
+
+
+def failure_text(line: Line) -> str:
+    kind = status(line)
+    return (
+        plain_text(line.output_lines.drop(1))
+        if kind == 'error' else
+        plain_text(line.result.report_lines)
+        if kind == 'failed' else
+        ''
+    )
+
+
+def seconds(line: Line) -> float:
+    return (
+        line.duration.total_seconds()
+        if isinstance(line, ResultLine) else
+        0.
+    )
+
+
+def reported(line: Line) -> bool:
+    return isinstance(line, (ResultLine, SkippedLine, FatalLine))
+
+
+class Reporter(abc.ABC):
+
+    def start_class(self, name: str) -> None:
+        pass
+
+    @abc.abstractmethod
+    def report(self, line: Line) -> None:
+        ...
+
+    def end_class(self) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+
+class FileReporter(Reporter):
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.out = path.open('w')  # type: IO[str]
+        self.cls = ''
+        self.counts = dict()  # type: dict
+        self.seconds = 0.
+
+    def start_class(self, name: str) -> None:
+        self.cls = name
+
+    def count(self, line: Line) -> str:
+        kind = status(line)
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        self.seconds += seconds(line)
+        return kind
+
+    def finish(self) -> None:
+        self.out.close()
+
+
+class JsonLinesReporter(FileReporter):
+
+    def write(self, data: dict) -> None:
+        self.out.write(json.dumps(data))
+        self.out.write('\n')
+
+    def report(self, line: Line) -> None:
+        if reported(line):
+            kind = self.count(line)
+            self.write(dict(event='spec', cls=self.cls,
+                            spec=getattr(line, 'text', ''), status=kind,
+                            seconds=seconds(line), failure=failure_text(line)))
+
+    def end_class(self) -> None:
+        self.out.flush()
+
+    def finish(self) -> None:
+        self.write(dict(event='summary', counts=self.counts,
+                        seconds=self.seconds))
+        super().finish()
+
+
+class JUnitReporter(FileReporter):
+    header = '<?xml version="1.0" encoding="utf-8"?>\n<testsuites>\n'
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.out.write(JUnitReporter.header)
+        self.cases = []  # type: list
+
+    def start_class(self, name: str) -> None:
+        super().start_class(name)
+        self.cases = []
+        self.counts = dict()
+        self.seconds = 0.
+
+    def attr(self, value: Any) -> str:
+        return quoteattr(invalid_xml.sub('', str(value)))
+
+    def text(self, value: str) -> str:
+        return escape(invalid_xml.sub('', value))
+
+    def case_body(self, kind: str, line: Line) -> str:
+        text = self.text(failure_text(line))
+        return (
+            '<failure message="spec failed">{}</failure>'.format(text)
+            if kind == 'failed' else
+            '<error message="error during spec run">{}</error>'.format(text)
+            if kind == 'error' else
+            '<skipped message="{}"/>'.format(kind)
+            if kind in ('pending', 'skipped') else
+            ''
+        )
+
+    def report(self, line: Line) -> None:
+        if reported(line):
+            kind = self.count(line)
+            name = getattr(line, 'text', '') or 'error'
+            self.cases.append(
+                '  <testcase classname={} name={} time="{:.6f}">{}'
+                '</testcase>\n'.format(self.attr(self.cls), self.attr(name),
+                                       seconds(line),
+                                       self.case_body(kind, line))
+            )
+
+    def end_class(self) -> None:
+        count = lambda *kinds: sum(self.counts.get(k, 0) for k in kinds)
+        self.out.write(
+            ' <testsuite name={} tests="{}" failures="{}" errors="{}" '
+            'skipped="{}" time="{:.6f}">\n'.format(
+                self.attr(self.cls), len(self.cases), count('failed'),
+                count('error'), count('pending', 'skipped'), self.seconds)
+        )
+        self.out.writelines(self.cases)
+        self.out.write(' </testsuite>\n')
+        self.out.flush()
+        self.cases = []
+
+    def finish(self) -> None:
+        self.out.write('</testsuites>\n')
+        super().finish()
+
+__all__ = ('Reporter', 'FileReporter', 'JsonLinesReporter', 'JUnitReporter')
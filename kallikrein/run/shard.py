@@ -0,0 +1,157 @@
+import re
+import json
+import heapq
+import hashlib
+from typing import Callable, TypeVar
+
+from amino import List, Either, Right, Left, Try, Path, _
+
+from kallikrein.run.data import SpecLocation, SpecsResult
+from kallikrein.run.history import DurationHistory, location_key, estimates
+
+A = TypeVar('A')
+shard_pattern = re.compile(r'(\d+)/(\d+)$')
+
+
+def stable_hash(key: str) -> int:
+    return int(hashlib.sha1(key.encode()).hexdigest()[:8], 16)
+
+
+def hash_partition(keys: List[str], count: int) -> List[int]:
+    return keys / (lambda a: stable_hash(a) % count)
+
+
+def balanced_partition(keys: List[str], weights: List[int], count: int
+                       ) -> List[int]:
+    order = sorted(range(len(keys)), key=lambda i: (-weights[i], keys[i]))
+    bins = [(0, b) for b in range(count)]
+    assignment = [0] * len(keys)
+    for i in order:
+        load, b = heapq.heappop(bins)
+        assignment[i] = b
+        heapq.heappush(bins, (load + weights[i], b))
+    return List.wrap(assignment)
+
+
+def read_shard_history(path: str) -> Either[str, DurationHistory]:
+    def read() -> DurationHistory:
+        with open(path) as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError('expected an object')
+        return DurationHistory(Path(path), data)
+    err = 'invalid shard history `{}`: {}'
+    return (
+        Try(read).lmap(lambda e: err.format(path, e.cause))
+        if path else
+        Right(DurationHistory(Path(path), dict()))
+    )
+
+
+class Shard:
+    invalid_msg = 'invalid shard `{}`, expected `i/n` with 1 <= i <= n'
+
+    @staticmethod
+    def parse(spec: str) -> Either[str, 'Shard']:
+        match = shard_pattern.match(spec)
+        index, count = map(int, match.groups()) if match else (0, 0)
+        return (
+            Right(Shard(index, count))
+            if 1 <= index <= count else
+            Left(Shard.invalid_msg.format(spec))
+        )
+
+    def __init__(self, index: int, count: int) -> None:
+        self.index = index
+        self.count = count
+
+    def partition(self, locations: List[SpecLocation],
+                  history: DurationHistory) -> List[int]:
+        keys = locations / location_key
+        known = locations / history.duration
+        return (
+            balanced_partition(keys, estimates(known), self.count)
+            if known.exists(_.is_just) else
+            hash_partition(keys, self.count)
+        )
+
+    def select(self, items: List[A], location: Callable[[A], SpecLocation],
+               history: DurationHistory) -> List[A]:
+        bins = self.partition(items / location, history)
+        return (
+            items.zip(bins)
+            .filter(lambda a: a[1] == self.index - 1) /
+            _[0]
+        )
+
+    @property
+    def default_result_path(self) -> Path:
+        name = 'shard-{}-of-{}.json'.format(self.index, self.count)
+        return Path('.kallikrein') / name
+
+    def __str__(self) -> str:
+        return '{}/{}'.format(self.index, self.count)
+
+
+class ShardResult:
+
+    def __init__(self, shard: str, keys: List[str], total: List[str],
+                 result: SpecsResult) -> None:
+        self.shard = shard
+        self.keys = keys
+        self.total = total
+        self.result = result
+
+    @staticmethod
+    def read(path: str) -> Either[str, 'ShardResult']:
+        def read() -> ShardResult:
+            with open(path) as f:
+                data = json.load(f)
+            keys = List.wrap(data['keys'])
+            specs = SpecsResult.from_data(data['specs'], keys,
+                                          data['elapsed'])
+            return ShardResult(data['shard'], keys, List.wrap(data['total']),
+                               specs)
+        err = 'invalid shard result `{}`: {}'
+        return Try(read).lmap(lambda e: err.format(path, e.cause))
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = dict(shard=self.shard, keys=list(self.keys),
+                    total=list(self.total), specs=self.result.data,
+                    elapsed=self.result.elapsed)
+        with path.open('w') as f:
+            json.dump(data, f)
+
+
+def check_shards(results: List[ShardResult]
+                 ) -> Either[str, List[ShardResult]]:
+    total = results.head / _.total | List()
+    keys = results // _.keys
+    duplicate = keys.filter(lambda a: keys.count(a) > 1).distinct
+    missing = total.filter(lambda a: a not in keys)
+    return (
+        Left('shards were selected from different specs')
+        if results.exists(lambda a: sorted(a.total) != sorted(total)) else
+        Left('classes in several shards: {}'.format(duplicate.join_comma))
+        if duplicate else
+        Left('classes missing from the shards: {}'.format(missing.join_comma))
+        if missing else
+        Right(results)
+    )
+
+
+def merge_shard_results(paths: List[str]) -> Either[str, ShardResult]:
+    def merge(results: List[ShardResult]) -> ShardResult:
+        specs = SpecsResult(results // _.result.specs,
+                            sum(results / _.result.elapsed))
+        total = results.head / _.total | List()
+        return ShardResult('', results // _.keys, total, specs)
+    return (
+        paths.traverse(ShardResult.read, Either)
+        .flat_map(check_shards) /
+        merge
+    )
+
+__all__ = ('Shard', 'ShardResult', 'merge_shard_results',
+           'read_shard_history')
@@ -0,0 +1,92 @@
+import time
+from typing import Any, Callable, TypeVar
+from datetime import timedelta
+
+from amino import List
+
+A = TypeVar('A')
+
+
+def perf_counter_ns() -> int:
+    return int(time.perf_counter() * 1e9)
+
+clock_ns = getattr(time, 'perf_counter_ns', perf_counter_ns)
+
+
+def format_ns(ns: int) -> str:
+    ms = ns / 1e6
+    return '{:.1f}ms'.format(ms) if ms < 1000 else '{:.3f}s'.format(ms / 1000)
+
+
+class SpecTiming:
+    spec_phases = List('instantiate', 'setup', 'spec', 'evaluate', 'teardown')
+    class_phases = List('setup_class', 'teardown_class')
+    phases = spec_phases + class_phases
+
+    def __init__(self, instantiate: int=0, setup: int=0, spec: int=0,
+                 evaluate: int=0, teardown: int=0, setup_class: int=0,
+                 teardown_class: int=0) -> None:
+        self.instantiate = instantiate
+        self.setup = setup
+        self.spec = spec
+        self.evaluate = evaluate
+        self.teardown = teardown
+        self.setup_class = setup_class
+        self.teardown_class = teardown_class
+
+    @staticmethod
+    def seconds(seconds: float) -> 'SpecTiming':
+        return SpecTiming(spec=int(seconds * 1e9))
+
+    @property
+    def values(self) -> List[int]:
+        return SpecTiming.phases / (lambda a: getattr(self, a))
+
+    @property
+    def total(self) -> int:
+        return sum(SpecTiming.spec_phases / (lambda a: getattr(self, a)))
+
+    @property
+    def fixture(self) -> int:
+        return self.setup + self.teardown
+
+    @property
+    def class_fixture(self) -> int:
+        return self.setup_class + self.teardown_class
+
+    @property
+    def wall(self) -> int:
+        return self.total + self.class_fixture
+
+    @property
+    def duration(self) -> timedelta:
+        return timedelta(microseconds=self.total / 1000)
+
+    def __add__(self, other: 'SpecTiming') -> 'SpecTiming':
+        return SpecTiming(*self.values.zip(other.values).map2(int.__add__))
+
+    def __str__(self) -> str:
+        phases = SpecTiming.phases.zip(self.values / format_ns)
+        return phases.map2('{} {}'.format).mk_string(', ')
+
+    def __repr__(self) -> str:
+        return '{}({})'.format(self.__class__.__name__, self)
+
+
+class PhaseTimer:
+
+    def __init__(self) -> None:
+        self.phases = dict()  # type: dict
+
+    def measure(self, phase: str, f: Callable[..., A], *a: Any) -> A:
+        start = clock_ns()
+        try:
+            return f(*a)
+        finally:
+            self.phases[phase] = self.phases.get(phase, 0) + clock_ns() - start
+
+    @property
+    def timing(self) -> SpecTiming:
+        return SpecTiming(**self.phases)
+
+__all__ = ('clock_ns', 'SpecTiming', 'PhaseTimer')
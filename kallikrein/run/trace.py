@@ -0,0 +1,105 @@
+import os
+import json
+import threading
+from typing import Any, Callable, TypeVar
+
+from amino import Path
+
+from kallikrein.run.timing import PhaseTimer, clock_ns
+
+A = TypeVar('A')
+
+
+class NullSpan:
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+null_span = NullSpan()
+
+
+class Span:
+
+    def __init__(self, tracer: 'Tracer', name: str, cat: str, args: dict
+                 ) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self) -> None:
+        self.start = clock_ns()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.tracer.record(self.name, self.cat, self.start, clock_ns(),
+                           self.args)
+
+
+class Tracer:
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.events = []  # type: list
+        self.lock = threading.Lock()
+
+    def start(self, process: str='main') -> None:
+        self.enabled = True
+        self.events = [dict(ph='M', name='process_name', pid=os.getpid(),
+                            tid=0, args=dict(name=process))]
+
+    def stop(self) -> None:
+        self.enabled = False
+
+    def span(self, name: str, cat: str, **args: Any) -> Any:
+        return Span(self, name, cat, args) if self.enabled else null_span
+
+    def record(self, name: str, cat: str, start: int, end: int, args: dict
+               ) -> None:
+        event = dict(name=name, cat=cat, ph='X', ts=start / 1000,
+                     dur=(end - start) / 1000, pid=os.getpid(),
+                     tid=threading.get_ident(), args=args)
+        with self.lock:
+            self.events.append(event)
+
+    def drain(self) -> list:
+        with self.lock:
+            events, self.events = self.events, []
+        return events
+
+    def extend(self, events: list) -> None:
+        with self.lock:
+            self.events.extend(events)
+
+    def write(self, path: Path) -> None:
+        metadata = set()  # type: set
+        def new(event: dict) -> bool:
+            key = event['pid'], event['name']
+            fresh = event['ph'] != 'M' or key not in metadata
+            metadata.add(key)
+            return fresh
+        events = [a for a in self.drain() if new(a)]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open('w') as f:
+            json.dump(dict(traceEvents=events, displayTimeUnit='ms'), f)
+
+
+class TracedPhaseTimer(PhaseTimer):
+
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self.name = name
+
+    def measure(self, phase: str, f: Callable[..., A], *a: Any) -> A:
+        with tracer.span(phase, 'phase', spec=self.name):
+            return super().measure(phase, f, *a)
+
+
+def phase_timer(name: str) -> PhaseTimer:
+    return TracedPhaseTimer(name) if tracer.enabled else PhaseTimer()
+
+tracer = Tracer()
+
+__all__ = ('Tracer', 'tracer', 'phase_timer')
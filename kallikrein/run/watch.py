@@ -0,0 +1,247 @@
+import os
+import sys
+import time
+import ctypes
+import select
+import struct
+import importlib
+import ctypes.util
+from typing import Set, Dict, Callable, Any, Iterable
+
+from amino import List, Maybe, Try, Path, Map
+from amino.logging import Logging
+
+from kallikrein.run.lookup_loc import package_roots, resolve_module
+from kallikrein.run.index import index
+from kallikrein.run.plan import spec_plans
+from kallikrein.run.imports import ImportGraph, module_name
+
+ignored_dirs = frozenset(('__pycache__', 'node_modules'))
+fixed_modules = frozenset(('__main__', __name__.split('.')[0]))
+
+
+def source_files(root: str) -> Iterable[str]:
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs
+                   if not d.startswith('.') and d not in ignored_dirs]
+        for name in files:
+            if name.endswith('.py'):
+                yield os.path.join(directory, name)
+
+
+def source_dirs(root: str) -> Iterable[str]:
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs
+                   if not d.startswith('.') and d not in ignored_dirs]
+        yield directory
+
+
+class PollingWatcher(Logging):
+    interval = .3
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self.mtimes = self.snapshot()
+
+    def snapshot(self) -> Dict[str, float]:
+        def mtime(path: str) -> float:
+            return Try(os.path.getmtime, path).to_maybe | -1.
+        return dict((path, mtime(path)) for path in source_files(self.root))
+
+    def changes(self) -> Set[str]:
+        current = self.snapshot()
+        paths = set(current) | set(self.mtimes)
+        changed = set(a for a in paths
+                      if current.get(a) != self.mtimes.get(a))
+        self.mtimes = current
+        return changed
+
+    def wait(self) -> Set[str]:
+        while True:
+            changed = self.changes()
+            if changed:
+                return changed
+            time.sleep(PollingWatcher.interval)
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher(Logging):
+    modify = 0x2
+    moved_from = 0x40
+    moved_to = 0x80
+    create = 0x100
+    delete = 0x200
+    close_write = 0x8
+    is_dir = 0x40000000
+    mask = modify | close_write | moved_from | moved_to | create | delete
+    event = struct.Struct('iIII')
+    settle = .05
+
+    @staticmethod
+    def create_in(root: str) -> Maybe['InotifyWatcher']:
+        def init() -> InotifyWatcher:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            fd = libc.inotify_init1(os.O_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+            return InotifyWatcher(root, libc, fd)
+        return Try(init).to_maybe
+
+    def __init__(self, root: str, libc: Any, fd: int) -> None:
+        self.root = root
+        self.libc = libc
+        self.fd = fd
+        self.dirs = dict()  # type: dict
+        for directory in source_dirs(root):
+            self.add(directory)
+
+    def add(self, directory: str) -> None:
+        wd = self.libc.inotify_add_watch(self.fd, directory.encode(),
+                                         InotifyWatcher.mask)
+        if wd >= 0:
+            self.dirs[wd] = directory
+
+    def events(self, data: bytes) -> Set[str]:
+        changed = set()  # type: Set[str]
+        offset = 0
+        size = InotifyWatcher.event.size
+        while offset + size <= len(data):
+            wd, mask, cookie, length = InotifyWatcher.event.unpack_from(
+                data, offset)
+            raw = data[offset + size:offset + size + length]
+            name = raw.rstrip(b'\0').decode(errors='replace')
+            offset += size + length
+            directory = self.dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+            if mask & InotifyWatcher.is_dir:
+                if mask & (InotifyWatcher.create | InotifyWatcher.moved_to):
+                    for sub in source_dirs(path):
+                        self.add(sub)
+                    changed.update(source_files(path))
+            elif name.endswith('.py'):
+                changed.add(path)
+        return changed
+
+    def wait(self) -> Set[str]:
+        changed = set()  # type: Set[str]
+        while not changed:
+            select.select([self.fd], [], [])
+            changed = self.events(os.read(self.fd, 65536))
+            while select.select([self.fd], [], [], InotifyWatcher.settle)[0]:
+                changed.update(self.events(os.read(self.fd, 65536)))
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def watcher(root: str) -> Any:
+    return (
+        InotifyWatcher.create_in(root)
+        if sys.platform.startswith('linux') else
+        Maybe(None)
+    ) | (lambda: PollingWatcher(root))
+
+
+class DependencyGraph:
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self.imports = ImportGraph(root)
+
+    @property
+    def local_modules(self) -> Map:
+        names = ((module_name(a), os.path.abspath(a))
+                 for a in source_files(self.root))
+        return Map((name, path) for name, path in names
+                   if name.split('.')[0] not in fixed_modules)
+
+    def dependencies(self, path: str) -> Set[str]:
+        return set(self.imports.module_imports(path))
+
+    def dependents(self, modules: Map) -> Dict[str, Set[str]]:
+        reverse = dict()  # type: dict
+        for name, path in modules.items():
+            for dep in self.dependencies(path):
+                if dep in modules and dep != name:
+                    reverse.setdefault(dep, set()).add(name)
+        return reverse
+
+    def affected(self, changed: Set[str]) -> List[str]:
+        modules = self.local_modules
+        self.imports.invalidate(modules.lift(a) | a for a in changed)
+        reverse = self.dependents(modules)
+        result = set()  # type: Set[str]
+        queue = list(changed)
+        while queue:
+            name = queue.pop()
+            if name not in result:
+                result.add(name)
+                queue.extend(reverse.get(name, ()))
+        return self.ordered(result, modules)
+
+    def ordered(self, names: Set[str], modules: Map) -> List[str]:
+        order = []  # type: list
+        visited = set()  # type: Set[str]
+        def visit(name: str) -> None:
+            if name not in visited:
+                visited.add(name)
+                for path in modules.lift(name):
+                    for dep in sorted(self.dependencies(path)):
+                        if dep in names:
+                            visit(dep)
+                order.append(name)
+        for name in sorted(names):
+            visit(name)
+        return List.wrap(order)
+
+
+def reload_module(name: str) -> Maybe[str]:
+    def reload() -> None:
+        mod = sys.modules.get(name)
+        if mod is not None and name.split('.')[0] not in fixed_modules:
+            importlib.reload(mod)
+    error = 'could not reload `{}`: {}'
+    return Try(reload).swap.to_maybe / (lambda e: error.format(name, e.cause))
+
+
+def reset_caches(paths: Set[str]) -> None:
+    package_roots.invalidate(paths)
+    index().invalidate(paths)
+
+
+class Watch(Logging):
+
+    def __init__(self, root: str, run: Callable[[Set[str]], Any]) -> None:
+        self.root = root
+        self.run = run
+        self.graph = DependencyGraph(root)
+
+    def changed_modules(self, paths: Set[str]) -> Set[str]:
+        return set(resolve_module(Path(a)) for a in paths)
+
+    def cycle(self, paths: Set[str]) -> Any:
+        reset_caches(paths)
+        modules = self.graph.affected(self.changed_modules(paths))
+        spec_plans.invalidate(modules)
+        errors = (modules / reload_module).join
+        errors % self.log.error
+        return self.run(set(modules))
+
+    def start(self, watch: Any) -> Any:
+        result = self.run(None)
+        try:
+            while True:
+                self.log.info('waiting for changes...')
+                result = self.cycle(watch.wait())
+        except KeyboardInterrupt:
+            return result
+        finally:
+            watch.close()
+
+__all__ = ('Watch', 'watcher', 'DependencyGraph', 'PollingWatcher',
+           'InotifyWatcher')
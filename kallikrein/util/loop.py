@@ -0,0 +1,50 @@
+import os
+import asyncio
+import threading
+from typing import Awaitable, TypeVar
+
+A = TypeVar('A')
+
+
+async def await_value(value: Awaitable[A]) -> A:
+    return await value
+
+
+class SpecLoop:
+    reentrant_msg = 'cannot block on the spec loop from a coroutine running on it'
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.loop = None  # type: asyncio.AbstractEventLoop
+        self.thread = None  # type: threading.Thread
+        self.pid = None  # type: int
+
+    def _start(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever,
+                                       name='kallikrein-loop', daemon=True)
+        self.thread.start()
+        self.pid = os.getpid()
+
+    @property
+    def running_loop(self) -> asyncio.AbstractEventLoop:
+        with self.lock:
+            if self.pid != os.getpid():
+                self._start()
+            return self.loop
+
+    def run(self, value: Awaitable[A]) -> A:
+        loop = self.running_loop
+        if threading.current_thread() is self.thread:
+            raise Exception(SpecLoop.reentrant_msg)
+        future = asyncio.run_coroutine_threadsafe(await_value(value), loop)
+        return future.result()
+
+
+spec_loop = SpecLoop()
+
+
+def run_async(value: Awaitable[A]) -> A:
+    return spec_loop.run(value)
+
+__all__ = ('spec_loop', 'run_async')
@@ -1,26 +1,56 @@
-from typing import Any
-
-from hues import huestr
+import os
+import re
+import sys
+from typing import Any, Callable
 
 from amino import __
 
+ansi_reset = '\x1b[0m'
+
+
+def color_enabled() -> bool:
+    if os.environ.get('NO_COLOR'):
+        return False
+    if os.environ.get('FORCE_COLOR'):
+        return True
+    isatty = getattr(sys.stdout, 'isatty', None)
+    return bool(isatty and isatty())
+
+
+def plain(msg: Any) -> str:
+    return str(msg)
+
 
-def green(msg: Any) -> str:
-    return huestr(str(msg)).green.colorized
+def ansi_style(code: str) -> Callable[[Any], str]:
+    start = '\x1b[{}m'.format(code)
+    def apply(msg: Any) -> str:
+        return start + str(msg) + ansi_reset
+    return apply
 
 
-def red(msg: Any) -> str:
-    return huestr(str(msg)).red.colorized
+def style(code: str) -> Callable[[Any], str]:
+    return ansi_style(code) if color else plain
 
+color = color_enabled()
 
-def yellow(msg: Any) -> str:
-    return huestr(str(msg)).yellow.colorized
+green = style('32')
 
-def blue(msg: Any) -> str:
-    return huestr(str(msg)).blue.colorized
+red = style('31')
+
+yellow = style('33')
+
+blue = style('34')
+
+bold_red = style('1;31')
 
 indent = __.map(' {}'.format)
 
+ansi_pattern = re.compile(r'\x1b\[[0-9;]*m')
+
+
+def strip_ansi(msg: str) -> str:
+    return ansi_pattern.sub('', msg)
+
 green_check = green('✓')
 
 red_cross = red('✗')
@@ -31,4 +61,5 @@ green_plus = green('+')
 
 red_minus = red('-')
 
-__all__ = ('indent', 'green_check', 'red_cross', 'green', 'red', 'yellow_clock', 'green_plus', 'red_minus', 'blue')
+__all__ = ('indent', 'green_check', 'red_cross', 'green', 'red', 'yellow_clock', 'green_plus', 'red_minus', 'blue',
+           'strip_ansi', 'yellow', 'bold_red', 'color_enabled')
@@ -0,0 +1,33 @@
+import sys
+import threading
+import traceback
+from typing import Callable, TypeVar
+
+from amino import Either, Left, Right, List
+
+A = TypeVar('A')
+
+
+def thread_stack(thread: threading.Thread) -> List[traceback.FrameSummary]:
+    frame = sys._current_frames().get(thread.ident)
+    return List() if frame is None else List.wrap(traceback.extract_stack(frame))
+
+
+def watchdog(f: Callable[[], A], timeout: float
+             ) -> Either[List[traceback.FrameSummary], A]:
+    result = dict()  # type: dict
+    def run() -> None:
+        try:
+            result['value'] = f()
+        except Exception as e:
+            result['error'] = e
+    thread = threading.Thread(target=run, name='kallikrein-spec', daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        return Left(thread_stack(thread))
+    if 'error' in result:
+        raise result['error']
+    return Right(result['value'])
+
+__all__ = ('watchdog',)
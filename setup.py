@@ -15,7 +15,6 @@ setup(
     install_requires=[
         'amino>=9.5.0',
         'golgi>=1.5.0',
-        'hues',
     ],
     entry_points={
         'console_scripts': [
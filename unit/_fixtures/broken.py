@@ -0,0 +1,24 @@
+from kallikrein_missing_dependency import BaseSpec
+
+
+class BrokenSpec(BaseSpec):
+    '''broken spec
+    inherited $inherited
+    '''
+
+
+class UndocumentedSpec:
+
+    def plain(self) -> None:
+        pass
+
+
+class StaticSpec:
+    '''static spec
+    static $static
+    '''
+
+    def static(self) -> None:
+        pass
+
+__all__ = ('BrokenSpec', 'UndocumentedSpec', 'StaticSpec')
@@ -0,0 +1,12 @@
+from kallikrein import k, Expectation
+
+
+class DeferredSpec:
+    '''deferred import
+    imported lazily $lazy
+    '''
+
+    def lazy(self) -> Expectation:
+        return k(1) == 1
+
+__all__ = ('DeferredSpec',)
@@ -0,0 +1,3 @@
+raise Exception('broken module')
+
+__all__ = list(['BrokenSpec'])
@@ -0,0 +1,12 @@
+from kallikrein import k, Expectation
+
+
+class ComputedSpec:
+    '''computed __all__
+    spec $spec
+    '''
+
+    def spec(self) -> Expectation:
+        return k(1) == 1
+
+__all__ = tuple(['ComputedSpec'])
@@ -0,0 +1,25 @@
+import time
+
+from kallikrein import k, Expectation, timeout
+
+
+class SlowSpec:
+    '''slow
+    slow spec $slow
+    '''
+
+    @timeout(5)
+    def slow(self) -> Expectation:
+        time.sleep(.6)
+        return k(1) == 1
+
+
+class QuickSpec:
+    '''quick
+    quick spec $quick
+    '''
+
+    def quick(self) -> Expectation:
+        return k(1) == 1
+
+__all__ = ('SlowSpec', 'QuickSpec')
@@ -0,0 +1,56 @@
+from amino import List
+
+from kallikrein import k, Expectation
+
+
+class ClassFixtureSpec:
+    '''class fixture
+    first $first
+    second $second
+    '''
+
+    setups = 0
+    teardowns = 0
+
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.setups += 1
+        cls.resource = List()
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        cls.teardowns += 1
+
+    def setup(self) -> None:
+        self.resource.append(1)
+
+    def first(self) -> Expectation:
+        return k(self.setups) == 1
+
+    def second(self) -> Expectation:
+        return (k(self.setups) == 1) & (k(self.resource) == List(1, 1))
+
+
+class FailingClassFixtureSpec:
+    '''failing class fixture
+    first $first
+    second $second
+    '''
+
+    teardowns = 0
+
+    @classmethod
+    def setup_class(cls) -> None:
+        raise Exception('no database')
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        cls.teardowns += 1
+
+    def first(self) -> Expectation:
+        return k(1) == 1
+
+    def second(self) -> Expectation:
+        return k(1) == 1
+
+__all__ = ('ClassFixtureSpec', 'FailingClassFixtureSpec')
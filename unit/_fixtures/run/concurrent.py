@@ -0,0 +1,58 @@
+from threading import Barrier
+
+from kallikrein import k, Expectation
+from kallikrein.matchers import greater_equal
+from kallikrein.util.string import green_check
+
+barrier = Barrier(3, timeout=5)
+pair = Barrier(2, timeout=5)
+
+
+class ConcurrentSpec:
+    '''concurrent specs
+    first $first
+    second $second
+
+    heading
+    third $third
+    '''
+    __concurrent__ = 3
+
+    def _meet(self) -> Expectation:
+        return k(barrier.wait()).must(greater_equal(0))
+
+    def first(self) -> Expectation:
+        return self._meet()
+
+    def second(self) -> Expectation:
+        return self._meet()
+
+    def third(self) -> Expectation:
+        return self._meet()
+
+
+target_report_concurrent = '''concurrent specs
+ {0} first
+ {0} second
+
+heading
+ {0} third
+'''.format(green_check)
+
+class DefaultConcurrentSpec:
+    '''default thread count
+    first $first
+    second $second
+    '''
+    __concurrent__ = True
+
+    def _meet(self) -> Expectation:
+        return k(pair.wait()).must(greater_equal(0))
+
+    def first(self) -> Expectation:
+        return self._meet()
+
+    def second(self) -> Expectation:
+        return self._meet()
+
+__all__ = ('ConcurrentSpec', 'DefaultConcurrentSpec')
@@ -0,0 +1,52 @@
+import asyncio
+
+from amino import List
+
+from kallikrein import k, kaf, Expectation
+from kallikrein.util.string import green_check
+
+
+async def value(a: int) -> int:
+    await asyncio.sleep(0.01)
+    return a
+
+
+class CoroutineSpec:
+    '''coroutine specs
+    first overlapping coroutine $first
+    second overlapping coroutine $second
+    awaitable expectation $awaitable
+    '''
+    __concurrent__ = 2
+
+    started = List()
+
+    @classmethod
+    def setup_class(cls) -> None:
+        cls.started = List()
+
+    async def _meet(self) -> Expectation:
+        self.started.append(1)
+        for i in range(500):
+            if len(self.started) >= 2:
+                break
+            await asyncio.sleep(0.01)
+        return k(len(self.started)) == 2
+
+    async def first(self) -> Expectation:
+        return await self._meet()
+
+    async def second(self) -> Expectation:
+        return await self._meet()
+
+    def awaitable(self) -> Expectation:
+        return kaf(value, 5) == 5
+
+
+target_report_coroutine = '''coroutine specs
+ {0} first overlapping coroutine
+ {0} second overlapping coroutine
+ {0} awaitable expectation
+'''.format(green_check)
+
+__all__ = ('CoroutineSpec',)
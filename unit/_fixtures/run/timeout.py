@@ -0,0 +1,22 @@
+from threading import Event
+
+from kallikrein import k, Expectation, timeout
+
+
+class TimeoutSpec:
+    '''timeout
+    hanging spec $hang
+    fast spec $fast
+    '''
+
+    __timeout__ = 5
+
+    @timeout(0.1)
+    def hang(self) -> Expectation:
+        Event().wait(1)
+        return k(1) == 1
+
+    def fast(self) -> Expectation:
+        return k(1) == 1
+
+__all__ = ('TimeoutSpec',)
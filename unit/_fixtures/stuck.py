@@ -0,0 +1,20 @@
+import time
+
+from kallikrein import k, Expectation
+
+
+class StuckSpec:
+    '''stuck
+    stuck spec $stuck
+    '''
+
+    __timeout__ = .1
+
+    @classmethod
+    def setup_class(cls) -> None:
+        time.sleep(5)
+
+    def stuck(self) -> Expectation:
+        return k(1) == 1
+
+__all__ = ('StuckSpec',)
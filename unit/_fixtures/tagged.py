@@ -0,0 +1,28 @@
+from kallikrein import k, Expectation, tag
+
+
+@tag('db')
+class TaggedSpec:
+    '''tagged specs
+    fast query $query
+    slow migration $migrate
+    '''
+
+    def query(self) -> Expectation:
+        return k(1) == 1
+
+    @tag('slow')
+    def migrate(self) -> Expectation:
+        return k(2) == 2
+
+
+class PlainSpec:
+    '''plain specs
+    simple query $query
+    '''
+    __tags__ = ('fast',)
+
+    def query(self) -> Expectation:
+        return k(3) == 3
+
+__all__ = ('TaggedSpec', 'PlainSpec')
@@ -3,7 +3,7 @@ from amino import List, L, _
 
 from kallikrein.matchers import greater_equal, forall
 from kallikrein import k
-from kallikrein.expectable import ExpectationFailed, unsafe_k, kf
+from kallikrein.expectable import ExpectationFailed, unsafe_k, kf, kaf
 from kallikrein.matcher import Matcher
 from kallikrein.expectation import (UnsafeExpectation, AlgExpectation,
                                     MultiExpectationResult)
@@ -67,6 +67,14 @@ class ExpectationSpec(Spec):
         assert result.present
         assert result.value.success
 
+    def async_callable(self) -> None:
+        async def f(a: int, b: int) -> List[int]:
+            return List(a + b)
+        exp = kaf(f, 5, 1).match(self._matcher)
+        result = exp.evaluate.attempt
+        assert result.present
+        assert result.value.success
+
     def true(self) -> None:
         exp = kf(lambda: True).true
         result = exp.evaluate.attempt
@@ -0,0 +1,62 @@
+import tempfile
+from datetime import timedelta
+
+from amino.test.spec_spec import Spec
+from amino import List, Path, Map, Just, Empty
+
+from kallikrein.run.history import DurationHistory, longest_first
+from kallikrein.run.data import SpecResult
+from kallikrein.run.line import PlainLine, ResultLine, SkippedLine
+from kallikrein.run.timing import SpecTiming
+from kallikrein.expectation import (CompactExpectationResult,
+                                    CachedExpectationResult)
+
+
+def _line(text: str, ns: int) -> ResultLine:
+    result = CompactExpectationResult(True, List(), False)
+    return ResultLine(text, None, result, timedelta(), SpecTiming(spec=ns))
+
+
+class HistorySpec(Spec):
+
+    def longest_first(self) -> None:
+        durations = dict(a=Just(3), b=Empty(), c=Just(10), d=Just(1))
+        order = longest_first(List('a', 'b', 'c', 'd'), durations.get)
+        assert order == List('c', 'b', 'a', 'd')
+        unknown = longest_first(List('b', 'a'), lambda a: Empty())
+        assert unknown == List('b', 'a')
+
+    def persist(self) -> None:
+        path = Path(tempfile.mkdtemp()) / 'durations.json'
+        history = DurationHistory.load(path)
+        spec = SpecResult(List(PlainLine('title'), _line('first', 5),
+                               _line('second', 7)))
+        history.update('mod.Cls', spec, Map(first='one', second='two'))
+        history.save()
+        reloaded = DurationHistory.load(path)
+        assert reloaded.get('mod.Cls').contains(12)
+        assert reloaded.get('mod.Cls.two').contains(7)
+        assert reloaded.get('mod.Cls.three').is_empty
+
+    def partial(self) -> None:
+        history = DurationHistory(Path(tempfile.mkdtemp()), dict())
+        names = Map(first='one', second='two', third='three')
+        specs = List('one', 'two', 'three')
+        full = SpecResult(List(_line('first', 5), _line('second', 7),
+                               _line('third', 4)))
+        history.update('mod.Cls', full, names, specs)
+        assert history.get('mod.Cls').contains(16)
+        selected = SpecResult(List(_line('first', 3)))
+        history.update('mod.Cls', selected, names, specs)
+        assert history.get('mod.Cls').contains(14)
+        cached = ResultLine('second', None, CachedExpectationResult(),
+                            timedelta())
+        skipped = SpecResult(List(_line('first', 2), cached,
+                                  SkippedLine('third')))
+        history.update('mod.Cls', skipped, names, specs)
+        assert history.get('mod.Cls').contains(13)
+        assert history.get('mod.Cls.two').contains(7)
+        history.update('mod.Cls', full, names, specs)
+        assert history.get('mod.Cls').contains(16)
+
+__all__ = ('HistorySpec',)
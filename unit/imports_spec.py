@@ -0,0 +1,44 @@
+import sys
+import tempfile
+
+from amino.test.spec_spec import Spec
+from amino import List, Path
+
+from kallikrein.run.imports import ImportGraph, imported_names
+
+modules = dict(
+    base='value = 1\n',
+    user='from .base import value\nimport os\n',
+    indirect='from pkg import user\n',
+)
+
+
+class ImportsSpec(Spec):
+
+    def names(self) -> None:
+        imports = List((1, 'base', ('value',)), (0, 'os', ()),
+                       (2, '', ('other',)))
+        assert imported_names('pkg.sub.mod', False, imports) == List(
+            'pkg.sub.base', 'pkg.sub.base.value', 'os', 'pkg', 'pkg.other')
+        assert imported_names('pkg', True, List((1, 'a', ()))) == List(
+            'pkg.a')
+
+    def closure(self) -> None:
+        root = Path(tempfile.mkdtemp())
+        pkg = root / 'pkg'
+        pkg.mkdir()
+        (pkg / '__init__.py').write_text('')
+        for name, source in modules.items():
+            (pkg / '{}.py'.format(name)).write_text(source)
+        sys.path.insert(0, str(root))
+        try:
+            graph = ImportGraph(str(root))
+            files = graph.closure(str(pkg / 'indirect.py'))
+            assert files == List.wrap(sorted(
+                str(pkg / '{}.py'.format(a))
+                for a in ('__init__', 'base', 'user', 'indirect')))
+            assert 'pkg' not in sys.modules
+        finally:
+            sys.path.remove(str(root))
+
+__all__ = ('ImportsSpec',)
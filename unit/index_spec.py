@@ -0,0 +1,138 @@
+import tempfile
+
+from amino.test.spec_spec import Spec
+from amino import Path, List, _
+
+from kallikrein.run.index import DiscoveryIndex, FileEntry, ClassEntry
+from kallikrein.run.lookup_loc import lookup_file, package_roots
+
+source = """import os
+
+
+class ASpec:
+    '''a spec
+    first $first
+    # inactive $inactive
+    '''
+
+    def first(self):
+        pass
+
+    def second(self):
+        pass
+
+
+def helper():
+    pass
+"""
+
+decorated = """class ASpec:
+
+    def first(self):
+        pass
+
+
+@tag('slow')
+class BSpec:
+
+    def second(self):
+        pass
+
+    @timeout(
+        2)
+    def third(self):
+        pass
+"""
+
+
+class IndexSpec(Spec):
+
+    def setup(self) -> None:
+        super().setup()
+        self.dir = Path(tempfile.mkdtemp())
+        self.file = self.dir / 'a_spec.py'
+        self.file.write_text(source)
+        self.index_path = self.dir / 'index.json'
+
+    def _entry(self, index: DiscoveryIndex) -> FileEntry:
+        e = index.entry(self.file)
+        assert e.present
+        return e.value
+
+    def scan(self) -> None:
+        entry = self._entry(DiscoveryIndex.load(self.index_path))
+        assert entry.classes / _.name == List('ASpec')
+        cls = entry.classes[0]
+        assert (cls.start, cls.end) == (4, 16)
+        assert cls.specs == List('first')
+        assert cls.method_at(14) == cls.method_at(13)
+        assert cls.method_at(13).contains('second')
+        assert entry.class_at(17).is_empty
+
+    def intervals(self) -> None:
+        extra = '\n\nclass BSpec:\n\n    def third(self):\n        pass\n'
+        self.file.write_text(source + extra)
+        index = DiscoveryIndex.load(self.index_path)
+        entry = self._entry(index)
+        assert self._entry(index) is entry
+        assert entry.class_at(3).is_empty
+        assert entry.class_at(4).map(_.name).contains('ASpec')
+        assert entry.class_at(16).map(_.name).contains('ASpec')
+        assert entry.class_at(17).is_empty
+        assert entry.class_at(21).map(_.name).contains('BSpec')
+        assert entry.classes[1].method_at(23).contains('third')
+        assert entry.classes[1].method_at(22).is_empty
+
+    def decorated(self) -> None:
+        self.file.write_text(decorated)
+        entry = self._entry(DiscoveryIndex.load(self.index_path))
+        a, b = entry.classes
+        assert (a.end, b.start, b.end) == (6, 7, 16)
+        assert entry.class_at(7).map(_.name).contains('BSpec')
+        assert b.method_at(12).contains('second')
+        assert b.method_at(13).contains('third')
+
+    def tags(self) -> None:
+        tagged = '''
+
+@tag('db')
+class BSpec:
+    __tags__ = ('io', 'net')
+
+    @kallikrein.tag('slow', 'x')
+    def third(self):
+        pass
+
+    def fourth(self):
+        pass
+'''
+        self.file.write_text(source + tagged)
+        cls = self._entry(DiscoveryIndex.load(self.index_path)).classes[1]
+        assert cls.tags('third') == List('db', 'io', 'net', 'slow', 'x')
+        assert cls.tags('fourth') == List('db', 'io', 'net')
+        restored = ClassEntry.from_data(cls.data)
+        assert restored.tags('third') == cls.tags('third')
+
+    def persist(self) -> None:
+        index = DiscoveryIndex.load(self.index_path)
+        self._entry(index)
+        index.save()
+        reloaded = DiscoveryIndex.load(self.index_path)
+        assert str(self.file) in reloaded.data
+        self._entry(reloaded)
+        assert not reloaded.dirty
+        self.file.write_text(source + '\n\nclass BSpec:\n    pass\n')
+        assert self._entry(reloaded).classes.length == 2
+        assert reloaded.dirty
+
+    def module(self) -> None:
+        pkg = self.dir / 'pkg'
+        pkg.mkdir()
+        path = pkg / 'a_spec.py'
+        path.write_text(source)
+        assert lookup_file(str(path)).value[0].mod == 'a_spec'
+        (pkg / '__init__.py').write_text('')
+        package_roots.invalidate([str(pkg / '__init__.py')])
+        assert lookup_file(str(path)).value[0].mod == 'pkg.a_spec'
+
+__all__ = ('IndexSpec',)
@@ -0,0 +1,42 @@
+from amino.test.spec_spec import Spec
+from amino import List
+
+from kallikrein.run.keyword import parse_keyword, Keywords
+
+keywords = Keywords('pkg.mod', 'ASpec', 'nested', 'successful nesting',
+                    List('slow'))
+
+
+class KeywordSpec(Spec):
+
+    def _matches(self, expr: str) -> bool:
+        e = parse_keyword(expr)
+        assert e.present
+        return e.value.matches(keywords)
+
+    def terms(self) -> None:
+        assert self._matches('nest')
+        assert self._matches('NESTING')
+        assert self._matches('pkg.mod.aspec.nested')
+        assert self._matches('pkg.*Spec')
+        assert not self._matches('simple')
+        assert not self._matches('slow')
+
+    def tags(self) -> None:
+        assert self._matches('tag:slow')
+        assert self._matches('tag:s*')
+        assert not self._matches('tag:sl')
+
+    def operators(self) -> None:
+        assert self._matches('nested and not simple')
+        assert self._matches('simple or tag:slow')
+        assert not self._matches('not (nested or simple)')
+        assert self._matches('not not nested')
+
+    def invalid(self) -> None:
+        assert parse_keyword('nested and').is_left
+        assert parse_keyword('(nested').is_left
+        assert parse_keyword('nested simple').is_left
+        assert parse_keyword('or').is_left
+
+__all__ = ('KeywordSpec',)
@@ -4,7 +4,7 @@ from amino import List
 from kallikrein import k
 from kallikrein.matchers.length import have_length
 from kallikrein.expectation import Expectation
-from kallikrein.match_result import MatchResult
+from kallikrein.match_result import MatchResult, LazyMatchResult
 from kallikrein.matchers import contain
 from kallikrein.matchers.contain import failure as contain_failure
 from kallikrein.matchers.typed import have_type
@@ -22,6 +22,18 @@ class AlgSpec(Spec):
     def success(self) -> None:
         self._run(k(List(2, 3, 4)).must(have_length(3) & contain(4)), True)
 
+    def render(self) -> None:
+        calls = []
+        def render() -> List[str]:
+            calls.append(1)
+            return List('message')
+        success = LazyMatchResult(True, render)
+        assert calls == []
+        LazyMatchResult(False, render)
+        assert calls == [1]
+        assert success.report == 'message'
+        assert calls == [1, 1]
+
     def failure(self) -> None:
         exp = List(2, 3, 4)
         n = 5
@@ -0,0 +1,87 @@
+import io
+import time
+import logging
+import threading
+
+from amino.test.spec_spec import Spec
+from amino import List
+
+import kallikrein.run.output
+from kallikrein.run.output import (BufferedOutput, output, use_output,
+                                   flushing_logs)
+
+
+class LoggingStream(io.StringIO):
+
+    def __init__(self, logger: logging.Logger) -> None:
+        super().__init__()
+        self.logger = logger
+
+    def write(self, text: str) -> int:
+        self.logger.warning('write')
+        return super().write(text)
+
+
+class OutputSpec(Spec):
+
+    def batch(self) -> None:
+        stream = io.StringIO()
+        out = BufferedOutput(stream, 0)
+        out.write(List('a', 'b'))
+        out.write(List('c'))
+        assert stream.getvalue() == ''
+        out.flush()
+        assert stream.getvalue() == 'a\nb\nc\n'
+        out.flush()
+        assert stream.getvalue() == 'a\nb\nc\n'
+
+    def timer(self) -> None:
+        stream = io.StringIO()
+        out = BufferedOutput(stream, .01)
+        out.write(List('a'))
+        deadline = time.monotonic() + 2
+        while not stream.getvalue() and time.monotonic() < deadline:
+            time.sleep(.01)
+        assert stream.getvalue() == 'a\n'
+        assert out.timer is None
+
+    def log_record(self) -> None:
+        stream = io.StringIO()
+        previous = output()
+        logger = logging.getLogger('kallikrein.output_spec')
+        handler = logging.StreamHandler(stream)
+        logger.addHandler(handler)
+        use_output(BufferedOutput(stream, 0))
+        factory = logging.getLogRecordFactory()
+        try:
+            with flushing_logs():
+                output().write(List('a', 'b'))
+                logger.warning('c')
+                output().write(List('d'))
+        finally:
+            logger.removeHandler(handler)
+            use_output(previous)
+        assert stream.getvalue() == 'a\nb\nc\nd\n'
+        assert logging.getLogRecordFactory() is factory
+
+    def log_from_stream(self) -> None:
+        previous = output()
+        logger = logging.getLogger('kallikrein.output_spec.stream')
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+        stream = LoggingStream(logger)
+        use_output(BufferedOutput(stream, 0))
+        def run() -> None:
+            with flushing_logs():
+                output().write(List('a'))
+                output().flush()
+        try:
+            thread = threading.Thread(target=run, daemon=True)
+            thread.start()
+            thread.join(5)
+        finally:
+            kallikrein.run.output.current_output = previous
+        assert not thread.is_alive()
+        assert stream.getvalue() == 'a\n'
+
+__all__ = ('OutputSpec',)
@@ -0,0 +1,60 @@
+import json
+import tempfile
+from xml.etree import ElementTree
+
+from amino.test.spec_spec import Spec
+from amino import List, Path
+
+from kallikrein.run.main import specs_run_task_lazy, convert_lazy_result
+from kallikrein.run.report import JUnitReporter, JsonLinesReporter
+
+from unit._fixtures.run.simple import Simple
+from unit._fixtures.run.pending import PendingSpec
+
+
+def _path(cls: type) -> str:
+    return '{}.{}'.format(cls.__module__, cls.__name__)
+
+
+class ReportSpec(Spec):
+
+    def setup(self) -> None:
+        super().setup()
+        self.dir = Path(tempfile.mkdtemp())
+        self.xml = self.dir / 'specs.xml'
+        self.jsonl = self.dir / 'specs.jsonl'
+        names = List(_path(Simple), _path(PendingSpec))
+        e = specs_run_task_lazy(names)
+        assert e.present
+        reporters = List(JUnitReporter(self.xml),
+                         JsonLinesReporter(self.jsonl))
+        self.result = convert_lazy_result(e.value, False,
+                                          reporters=reporters, names=names)
+
+    def junit(self) -> None:
+        root = ElementTree.parse(str(self.xml)).getroot()
+        suites = root.findall('testsuite')
+        assert [a.get('name') for a in suites] == [_path(Simple),
+                                                   _path(PendingSpec)]
+        simple, pending = suites
+        assert simple.get('tests') == '3'
+        assert simple.get('failures') == '1'
+        failure = simple.find('testcase/failure')
+        assert failure is not None
+        assert 'does not contain' in failure.text
+        assert '\x1b' not in failure.text
+        assert pending.get('skipped') == '1'
+
+    def json_lines(self) -> None:
+        with self.jsonl.open() as f:
+            events = [json.loads(a) for a in f]
+        specs = [a for a in events if a['event'] == 'spec']
+        assert len(specs) == 5
+        assert [a['status'] for a in specs] == ['passed', 'passed', 'failed',
+                                                'pending', 'passed']
+        assert specs[0]['cls'] == _path(Simple)
+        summary = events[-1]
+        assert summary['event'] == 'summary'
+        assert summary['counts'] == dict(passed=3, failed=1, pending=1)
+
+__all__ = ('ReportSpec',)
@@ -1,26 +1,53 @@
+import io
+import os
+import sys
 import inspect
+import tempfile
+import importlib
+from typing import Any
+from datetime import timedelta
 
 from amino.test.spec_spec import Spec
-from amino import List, Right, Left, Path, Just, Empty, __, _, Maybe
+from amino import List, Right, Left, Path, Just, Empty, __, _, Maybe, L, Map
 from amino.list import Lists
 from amino.task import TaskException
 
 from kallikrein.run.main import (runners, specs_run_task, lookup_loc,
-                                 specs_run_task_lazy, convert_lazy_result)
-from kallikrein.run.line import SpecLine
+                                 specs_run_task_lazy, convert_lazy_result,
+                                 specs_run_parallel, run_specs_lazy,
+                                 use_cache, update_cache, LinePrinter,
+                                 WorkerPool, kallikrein_run_lazy)
+from kallikrein.run.cache import ResultCache, SourceHasher
+from kallikrein.run.output import (output, use_output, flush_output,
+                                   BufferedOutput)
+from kallikrein.run.lookup_loc import (resolve_module, package_roots,
+                                       import_modules, DeadlockError)
+from kallikrein.run.line import SpecLine, ResultLine
+from kallikrein.run.plan import spec_plans
+from kallikrein.run.keyword import parse_keyword
 from kallikrein.expectation import (MultiExpectationResult,
                                     PendingExpectationResult,
-                                    SingleExpectationResult)
-from kallikrein.run.data import SpecLocation
+                                    SingleExpectationResult,
+                                    CompactExpectationResult)
+from kallikrein.run.data import SpecLocation, FailureLimit, SpecsResult
 from kallikrein.match_result import MatchResult
 from kallikrein.util.string import green_check
 
 from unit._fixtures.run.simple import (Simple, target_report, EmptySpec,
-                                       target_report_method)
+                                       target_report_method, l1, l6)
 from unit._fixtures.run.unsafe import target_report_unsafe
 from unit._fixtures.run.exception import target_report_exception
 from unit._fixtures.run.pending import PendingSpec
 from unit._fixtures.run.all_specs import AllSpecsSpec
+from unit._fixtures.run.concurrent import (ConcurrentSpec,
+                                           DefaultConcurrentSpec,
+                                           target_report_concurrent)
+from unit._fixtures.run.coroutine import (CoroutineSpec,
+                                          target_report_coroutine)
+from unit._fixtures.run.class_fixture import (ClassFixtureSpec,
+                                              FailingClassFixtureSpec)
+from unit._fixtures.run.timeout import TimeoutSpec
+from unit._fixtures.queued import SlowSpec, QuickSpec
 
 
 def _spec_path(cls: type) -> str:
@@ -66,13 +93,19 @@ def _lookup(spec: str, count: int=1, meth: Maybe=Empty()) -> SpecLocation:
     assert len(locs) == count
     loc = locs[-1]
     assert loc.mod == spec_mod_name
-    assert loc.cls == Simple
+    assert loc.cls.contains(Simple)
     assert loc.meth == meth
     return locs
 
 
 class RunSpec(Spec):
 
+    def setup(self) -> None:
+        super().setup()
+        ClassFixtureSpec.setups = 0
+        ClassFixtureSpec.teardowns = 0
+        FailingClassFixtureSpec.teardowns = 0
+
     def file_lnum_loc(self) -> None:
         _lookup(spec_file_lnum, meth=Just('simple'))
 
@@ -83,7 +116,7 @@ class RunSpec(Spec):
         locs = _lookup(simple_file_path, count=2)
         loc_e = locs[0]
         assert loc_e.mod == spec_mod_name
-        assert loc_e.cls == EmptySpec
+        assert loc_e.cls.contains(EmptySpec)
         assert loc_e.meth == Empty()
 
     def file_lnum_loc_file(self) -> None:
@@ -98,6 +131,13 @@ class RunSpec(Spec):
         # locs = result.value
         # assert len(locs) == 7
 
+    def resolve_module(self) -> None:
+        package_roots.clear()
+        assert resolve_module(Path(simple_file_path)) == spec_mod_name
+        assert str(main_dir) in package_roots.packages
+        other = resolve_module(main_dir / 'other.py')
+        assert other == '{}.other'.format(spec_pkg)
+
     def path_mod(self) -> None:
         _lookup(spec_mod_name, count=2)
 
@@ -105,7 +145,34 @@ class RunSpec(Spec):
         result = lookup_loc('run')
         assert result.present
         locs = result.value
-        assert len(locs) == 7
+        assert len(locs) == 13
+
+    def path_package_dynamic(self) -> None:
+        result = lookup_loc('dynamic')
+        assert result.present
+        assert result.value / _.cls_name == List('<module>', 'ComputedSpec')
+        run = specs_run_task(List('dynamic')).attempt
+        assert run.present
+        assert run.value.success_count == 1
+        assert run.value.failure_count == 1
+        assert 'broken module' in run.value.report
+        assert 'dynamic/broken.py' in run.value.report
+
+    def import_deadlock(self) -> None:
+        calls = []  # type: list
+        import_module = importlib.import_module
+        def deadlock(name: str) -> Any:
+            calls.append(name)
+            if calls.count(name) == 1:
+                raise DeadlockError('deadlock detected by test')
+            return import_module(name)
+        importlib.import_module = deadlock
+        try:
+            result = import_modules(List('json', 'csv'))
+        finally:
+            importlib.import_module = import_module
+        assert result.forall(_.present)
+        assert sorted(calls) == ['csv', 'csv', 'json', 'json']
 
     def path_class(self) -> None:
         _lookup(spec_cls_path)
@@ -123,6 +190,30 @@ class RunSpec(Spec):
         assert len(lines) == 9
         assert len(lines.filter_type(SpecLine)) == 3
 
+    def plan(self) -> None:
+        spec_plans.clear()
+        first = runners(List(spec_cls_path))
+        second = runners(List(spec_cls_path))
+        assert len(spec_plans.plans) == 1
+        lines = second.value[0].lines
+        assert len(lines) == len(first.value[0].lines) == 9
+        assert lines.filter_type(SpecLine) / _.name == List('simple', 'nested',
+                                                             'failure')
+
+    def plan_import(self) -> None:
+        spec_plans.clear()
+        path = str(base / '_fixtures' / 'deferred.py')
+        deferred = runners(List(path))
+        try:
+            assert not deferred.value[0].location.imported
+            imported = runners(List('unit._fixtures.deferred.DeferredSpec'))
+            assert imported.value[0].location.imported
+            assert len(spec_plans.plans) == 1
+            assert kallikrein_run_lazy(List(spec_cls_path)).present
+            assert spec_plans.plans == dict()
+        finally:
+            sys.modules.pop('unit._fixtures.deferred', None)
+
     def _run(self, specs: List[str]) -> MatchResult:
         task = specs_run_task(specs)
         result = task.attempt
@@ -218,6 +309,291 @@ class RunSpec(Spec):
         spec_result = convert_lazy_result(results, False)
         assert spec_result.report == target_report
 
+    def compact(self) -> None:
+        e = specs_run_task_lazy(List(simple_file_path, _file_path('exception')))
+        assert e.present
+        spec_result = convert_lazy_result(e.value, False, True)
+        target = '{}\n{}'.format(target_report, target_report_exception)
+        assert spec_result.report == target
+        assert spec_result.results.forall(lambda a: a.spec is None)
+        assert spec_result.results.forall(
+            lambda a: isinstance(a.result, CompactExpectationResult))
+
+    def quiet(self) -> None:
+        e = specs_run_task_lazy(List(spec_cls_path))
+        assert e.present
+        spec_result = convert_lazy_result(e.value, False)
+        stream = io.StringIO()
+        previous = output()
+        rendered = []
+        output_lines = ResultLine.output_lines
+        def render(line: ResultLine) -> List[str]:
+            rendered.append(line.text)
+            return output_lines.__get__(line, ResultLine)
+        ResultLine.output_lines = property(render)
+        use_output(BufferedOutput(stream, 0))
+        try:
+            printer = LinePrinter(True)
+            spec_result.specs[0].results % printer.print_line
+            flush_output()
+        finally:
+            ResultLine.output_lines = output_lines
+            use_output(previous)
+        assert rendered == [l6]
+        printed = stream.getvalue().splitlines()
+        assert printed[0] == l1
+        assert l6 in printed[1]
+
+    def max_failures(self) -> None:
+        limit = FailureLimit(1)
+        specs = List(simple_file_path, _spec_path(ClassFixtureSpec),
+                     _file_path('exception'))
+        e = specs_run_task_lazy(specs, limit)
+        assert e.present
+        teardowns = ClassFixtureSpec.teardowns
+        spec_result = convert_lazy_result(e.value, False, False, limit)
+        assert spec_result.results.length == 3
+        assert spec_result.failure_count == 1
+        assert spec_result.skipped_count == 3
+        assert '3 skipped' in spec_result.stats
+        assert ClassFixtureSpec.teardowns == teardowns
+
+    def parallel(self) -> None:
+        e = specs_run_parallel(List(simple_file_path, _file_path('exception')),
+                               2)
+        assert e.present
+        spec_result = convert_lazy_result(e.value, False)
+        target = '{}\n{}'.format(target_report, target_report_exception)
+        assert spec_result.report == target
+        assert spec_result.success_count == 2
+        assert spec_result.failure_count == 2
+
+    def concurrent(self) -> None:
+        e = specs_run_task_lazy(List(_spec_path(ConcurrentSpec)))
+        assert e.present
+        spec_result = convert_lazy_result(e.value, False)
+        assert spec_result.report == target_report_concurrent
+
+    def concurrent_default(self) -> None:
+        task = specs_run_task(List(_spec_path(DefaultConcurrentSpec)))
+        result = task.attempt
+        assert result.present
+        assert result.value.success_count == 2
+
+    def coroutine(self) -> None:
+        for i in range(2):
+            e = specs_run_task_lazy(List(_spec_path(CoroutineSpec)))
+            assert e.present
+            spec_result = convert_lazy_result(e.value, False)
+            assert spec_result.report == target_report_coroutine
+
+    def class_fixture(self) -> None:
+        setups = ClassFixtureSpec.setups
+        teardowns = ClassFixtureSpec.teardowns
+        task = specs_run_task(List(_spec_path(ClassFixtureSpec)))
+        result = task.attempt
+        assert result.present
+        assert result.value.success_count == 2
+        assert ClassFixtureSpec.setups == setups + 1
+        assert ClassFixtureSpec.teardowns == teardowns + 1
+
+    def failing_class_fixture(self) -> None:
+        teardowns = FailingClassFixtureSpec.teardowns
+        task = specs_run_task(List(_spec_path(FailingClassFixtureSpec)))
+        result = task.attempt
+        assert result.present
+        assert result.value.failure_count == 2
+        assert 'no database' in result.value.report
+        assert FailingClassFixtureSpec.teardowns == teardowns
+
+    def timeout(self) -> None:
+        e = specs_run_task_lazy(List(_spec_path(TimeoutSpec)))
+        assert e.present
+        spec_result = convert_lazy_result(e.value, False)
+        assert spec_result.success_count == 1
+        assert spec_result.failure_count == 1
+        assert 'spec timed out after 0.1s:' in spec_result.report
+        assert 'in hang' in spec_result.report
+
+    def parallel_timeout(self) -> None:
+        e = specs_run_parallel(List(_spec_path(TimeoutSpec),
+                                    simple_file_path), 2)
+        assert e.present
+        spec_result = convert_lazy_result(e.value, False)
+        assert spec_result.success_count == 3
+        assert spec_result.failure_count == 2
+        assert 'spec timed out after 0.1s:' in spec_result.report
+
+    def queued_budget(self) -> None:
+        slow, quick = runners(List(_spec_path(SlowSpec),
+                                   _spec_path(QuickSpec))).value
+        pool = WorkerPool(1, .2)
+        pool.grace = .1
+        try:
+            pool.submit(slow)
+            pool.submit(quick)
+            quick_lines = pool.result(quick)
+            slow_lines = pool.result(slow)
+        finally:
+            pool.shutdown()
+        results = (quick_lines + slow_lines).filter_type(ResultLine)
+        assert results.length == 2
+        assert results.forall(_.success)
+
+    def deferred_budget(self) -> None:
+        stuck, = runners(List(str(base / '_fixtures' / 'stuck.py'))).value
+        assert not stuck.location.imported
+        pool = WorkerPool(1, 0.)
+        pool.grace = .1
+        try:
+            pool.submit(stuck)
+            lines = pool.result(stuck)
+        finally:
+            pool.shutdown()
+        assert lines.exists(lambda a: WorkerPool.killed_msg in a.output)
+
+    def timing(self) -> None:
+        task = specs_run_task(List(_spec_path(ClassFixtureSpec)))
+        result = task.attempt
+        assert result.present
+        specs = result.value
+        assert specs.results.forall(lambda a: a.timing.spec > 0)
+        assert specs.results.forall(lambda a: a.timing.setup > 0)
+        assert specs.results.forall(lambda a: a.timing.teardown == 0)
+        assert specs.timing.total == sum(specs.results / _.timing.total)
+
+    def durations(self) -> None:
+        names = List(_spec_path(TimeoutSpec), _spec_path(ClassFixtureSpec))
+        e = specs_run_task_lazy(names)
+        assert e.present
+        result = convert_lazy_result(e.value, False, names=names)
+        assert result.elapsed >= result.timing.wall
+        durations = result.durations(1)
+        assert durations.specs.length == 1
+        assert durations.specs[0].name == '{}: hanging spec'.format(names[0])
+        assert durations.classes / _.name == names.take(1)
+        assert 0 < durations.classes[0].share <= 1
+        strict = specs_run_task(names).attempt
+        assert strict.value.specs / _.key == names
+        assert durations.data['specs'][0]['seconds'] >= 0.1
+
+    def incremental(self) -> None:
+        path = Path(tempfile.mkdtemp()) / 'results.json'
+        def run() -> SpecsResult:
+            cache = ResultCache.load(path)
+            rs = runners(List(simple_file_path)).value / L(use_cache)(cache, _)
+            result = convert_lazy_result(run_specs_lazy(rs), False)
+            update_cache(cache, rs, result)
+            return result
+        first = run()
+        assert first.cached_count == 0
+        second = run()
+        assert second.cached_count == first.success_count
+        assert second.success_count == first.success_count
+        assert second.failure_count == first.failure_count
+        assert '(cached)' in second.report
+
+    def incremental_helper(self) -> None:
+        root = Path(tempfile.mkdtemp())
+        source = root / 'helper_spec.py'
+        helper = root / 'helper_mod.py'
+        template = '''from kallikrein import k
+from helper_mod import imported
+
+def helper():
+    return {}
+
+class HelperSpec:
+    """helper
+    uses helper $uses
+    """
+
+    def uses(self):
+        return k(helper() + imported()) == 2
+'''
+        helper_template = 'def imported():\n    return {}\n'
+        source.write_text(template.format(1))
+        helper.write_text(helper_template.format(1))
+        sys.path.insert(0, str(root))
+        try:
+            loc = runners(List(str(source))).value[0].location
+            data = dict()  # type: dict
+            def cache() -> ResultCache:
+                return ResultCache(root / 'results.json', data,
+                                   SourceHasher(str(root)))
+            def passed() -> List[str]:
+                return cache().passed(loc)
+            result = CompactExpectationResult(True, List(), False)
+            line = ResultLine('uses helper', None, result, timedelta())
+            names = Map({'uses helper': 'uses'})
+            cache().update(loc, names, List(line))
+            assert passed() == List('uses')
+            source.write_text(template.format(2))
+            assert passed() == List()
+            cache().update(loc, names, List(line))
+            assert passed() == List('uses')
+            helper.write_text(helper_template.format(2))
+            assert passed() == List()
+            assert 'helper_spec' not in sys.modules
+            assert 'helper_mod' not in sys.modules
+        finally:
+            sys.path.remove(str(root))
+
+    def incremental_deferred(self) -> None:
+        mod = 'unit._fixtures.deferred'
+        path = str(base / '_fixtures' / 'deferred.py')
+        cache = ResultCache(Path(tempfile.mkdtemp()) / 'results.json',
+                            dict(), SourceHasher(os.getcwd()))
+        sys.modules.pop(mod, None)
+        rs = runners(List(path)).value / L(use_cache)(cache, _)
+        assert rs.forall(lambda a: not a.location.imported)
+        assert mod not in sys.modules
+
+    def deferred_import(self) -> None:
+        mod = 'unit._fixtures.deferred'
+        path = str(base / '_fixtures' / 'deferred.py')
+        e = runners(List(path))
+        assert e.present
+        assert mod not in sys.modules
+        assert e.value.forall(lambda a: not a.location.imported)
+        result = convert_lazy_result(run_specs_lazy(e.value), False)
+        assert mod in sys.modules
+        assert result.success_count == 1
+
+    def broken_file(self) -> None:
+        path = base / '_fixtures' / 'broken.py'
+        def error(loc: str) -> str:
+            e = runners(List(loc))
+            assert e.is_left
+            return str(e.value)
+        missing = 'kallikrein_missing_dependency'
+        assert missing in error(str(path))
+        assert missing in error('{}:UndocumentedSpec'.format(path))
+        assert missing in error('{}:12'.format(path))
+        assert specs_run_task(List(str(path))).attempt.is_left
+        static = specs_run_task(List('{}:StaticSpec'.format(path))).attempt
+        assert static.present
+        assert static.value.failure_count == 1
+        assert "No module named '{}'".format(missing) in static.value.report
+        assert 'broken.py' in static.value.report
+        assert 'get_or_raise' not in static.value.report
+
+    def keyword(self) -> None:
+        mod = 'unit._fixtures.tagged'
+        path = str(base / '_fixtures' / 'tagged.py')
+        def select(expr: str) -> List:
+            e = parse_keyword(expr) // (lambda a: runners(List(path), Just(a)))
+            assert e.present
+            return e.value / (lambda a: (a.location.cls_name,
+                                         a.spec_lines / _.name))
+        assert select('tag:slow') == List(('TaggedSpec', List('migrate')))
+        assert select('query and not tag:db') == List(('PlainSpec',
+                                                        List('query')))
+        assert select('tag:fast or migration') == List(
+            ('TaggedSpec', List('migrate')), ('PlainSpec', List('query')))
+        assert select('nothing').is_empty
+        assert mod not in sys.modules
+
     def stats(self) -> None:
         task = specs_run_task(List(_file_path('simple')))
         e = task.attempt
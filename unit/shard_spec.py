@@ -0,0 +1,109 @@
+import tempfile
+
+from amino.test.spec_spec import Spec
+from amino import List, Path, Empty, _
+
+from kallikrein.run.shard import (Shard, ShardResult, merge_shard_results,
+                                  read_shard_history)
+from kallikrein.run.history import DurationHistory, location_key
+from kallikrein.run.data import SpecLocation, ModuleSelector
+from kallikrein.run.main import specs_run_task
+
+from unit._fixtures.run.simple import Simple
+from unit._fixtures.run.pending import PendingSpec
+
+names = List.range(20) / 'Spec{}'.format
+locations = names / (lambda a: SpecLocation('mod', type(a, (), {}), Empty(),
+                                            ModuleSelector('mod')))
+
+
+def _spec_path(cls: type) -> str:
+    return '{}.{}'.format(cls.__module__, cls.__name__)
+
+
+class ShardSpec(Spec):
+
+    def setup(self) -> None:
+        super().setup()
+        self.dir = Path(tempfile.mkdtemp())
+        self.history = DurationHistory(self.dir / 'durations.json', dict())
+
+    def _shards(self, count: int) -> List[List[SpecLocation]]:
+        return (
+            List.range(1, count + 1) /
+            (lambda i: Shard(i, count).select(locations, lambda a: a,
+                                              self.history))
+        )
+
+    def parse(self) -> None:
+        shard = Shard.parse('2/8')
+        assert shard.present
+        assert (shard.value.index, shard.value.count) == (2, 8)
+        assert Shard.parse('0/8').is_left
+        assert Shard.parse('9/8').is_left
+        assert Shard.parse('2-8').is_left
+
+    def hash(self) -> None:
+        shards = self._shards(3)
+        assert shards == self._shards(3)
+        assert sorted(shards.join / location_key) == sorted(
+            locations / location_key)
+
+    def balanced(self) -> None:
+        weights = List.range(20) / (lambda a: (a + 1) * 1000)
+        self.history.data.update(
+            dict(locations.map(location_key).zip(weights)))
+        shards = self._shards(4)
+        assert shards.join.length == 20
+        loads = shards / (lambda a: sum((a / self.history.duration).join))
+        assert max(loads) <= 1.1 * sum(weights) / 4
+
+    def history(self) -> None:
+        empty = read_shard_history('')
+        assert empty.present
+        assert empty.value.data == dict()
+        path = self.dir / 'history.json'
+        path.write_text('{"mod.Spec1": 5}')
+        assert read_shard_history(str(path)).value.data == {'mod.Spec1': 5}
+        path.write_text('[]')
+        assert read_shard_history(str(path)).is_left
+        assert read_shard_history(str(self.dir / 'none')).is_left
+
+    def _write_shard(self, cls: type, index: int, total: List[str]) -> str:
+        task = specs_run_task(List(_spec_path(cls)))
+        path = self.dir / 'shard-{}.json'.format(index)
+        ShardResult('{}/2'.format(index), List(_spec_path(cls)), total,
+                    task.attempt.value).write(path)
+        return str(path)
+
+    def merge(self) -> None:
+        total = List(_spec_path(Simple), _spec_path(PendingSpec))
+        paths = List(self._write_shard(Simple, 1, total),
+                     self._write_shard(PendingSpec, 2, total))
+        merged = merge_shard_results(paths)
+        assert merged.present
+        result = merged.value.result
+        assert merged.value.keys == List(_spec_path(Simple),
+                                         _spec_path(PendingSpec))
+        assert result.specs.length == 2
+        assert result.specs / _.key == merged.value.keys
+        assert result.results.length == 5
+        assert result.failure_count == 2
+        assert 'some elements do not match' in result.report
+        assert merge_shard_results(List(str(self.dir / 'none'))).is_left
+
+    def merge_incomplete(self) -> None:
+        total = List(_spec_path(Simple), _spec_path(PendingSpec))
+        first = self._write_shard(Simple, 1, total)
+        missing = merge_shard_results(List(first))
+        assert missing.is_left
+        assert _spec_path(PendingSpec) in missing.value
+        duplicate = merge_shard_results(
+            List(first, self._write_shard(Simple, 2, total)))
+        assert duplicate.is_left
+        assert _spec_path(Simple) in duplicate.value
+        other = self._write_shard(PendingSpec, 2,
+                                  List(_spec_path(PendingSpec)))
+        assert merge_shard_results(List(first, other)).is_left
+
+__all__ = ('ShardSpec',)
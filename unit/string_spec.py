@@ -0,0 +1,33 @@
+import os
+
+from amino.test.spec_spec import Spec
+
+from kallikrein.util.string import (color_enabled, ansi_style, plain,
+                                    strip_ansi)
+
+
+class StringSpec(Spec):
+
+    def setup(self) -> None:
+        super().setup()
+        self.env = dict(os.environ)
+
+    def teardown(self) -> None:
+        super().teardown()
+        os.environ.clear()
+        os.environ.update(self.env)
+
+    def detect(self) -> None:
+        os.environ.pop('FORCE_COLOR', None)
+        os.environ['NO_COLOR'] = '1'
+        assert not color_enabled()
+        del os.environ['NO_COLOR']
+        os.environ['FORCE_COLOR'] = '1'
+        assert color_enabled()
+
+    def style(self) -> None:
+        green = ansi_style('32')
+        assert green(5) == '\x1b[32m5\x1b[0m'
+        assert strip_ansi(green('text')) == plain('text') == 'text'
+
+__all__ = ('StringSpec',)
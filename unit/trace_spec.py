@@ -0,0 +1,45 @@
+import json
+import tempfile
+
+from amino.test.spec_spec import Spec
+from amino import List, Path
+
+from kallikrein.run.main import specs_run_task_lazy, convert_lazy_result
+from kallikrein.run.trace import tracer, null_span, phase_timer
+from kallikrein.run.timing import PhaseTimer
+
+from unit._fixtures.run.simple import Simple
+
+
+class TraceSpec(Spec):
+
+    def teardown(self) -> None:
+        super().teardown()
+        tracer.stop()
+        tracer.drain()
+
+    def disabled(self) -> None:
+        assert tracer.span('lookup', 'discovery') is null_span
+        assert type(phase_timer('spec')) is PhaseTimer
+
+    def run(self) -> None:
+        path = Path(tempfile.mkdtemp()) / 'trace.json'
+        tracer.start()
+        name = '{}.{}'.format(Simple.__module__, Simple.__name__)
+        e = specs_run_task_lazy(List(name))
+        assert e.present
+        convert_lazy_result(e.value, False, names=List(name))
+        tracer.stop()
+        tracer.write(path)
+        with path.open() as f:
+            events = json.load(f)['traceEvents']
+        spans = [a for a in events if a['ph'] == 'X']
+        def named(cat: str) -> list:
+            return [a['name'] for a in spans if a['cat'] == cat]
+        assert named('discovery') == ['lookup', 'save index', 'plan']
+        assert named('runner') == ['class']
+        assert named('phase').count('spec') == 3
+        assert all(a['dur'] >= 0 for a in spans)
+        assert events[0]['args'] == dict(name='main')
+
+__all__ = ('TraceSpec',)
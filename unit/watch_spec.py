@@ -0,0 +1,140 @@
+import os
+import sys
+import tempfile
+from typing import Any
+
+from amino.test.spec_spec import Spec
+from amino import List, Path
+
+from kallikrein.run.watch import (DependencyGraph, PollingWatcher,
+                                  InotifyWatcher, Watch)
+from kallikrein.run.main import kallikrein_run_lazy
+from kallikrein.run.lookup_loc import package_roots, resolve_module
+from kallikrein.run.plan import spec_plans, SpecPlan
+
+spec_source = """from kallikrein import k, Expectation
+
+from watchpkg.indirect import total
+
+
+class TotalSpec:
+    '''total $total
+    '''
+
+    def total(self) -> Expectation:
+        return k(total) == 6
+"""
+
+modules = dict(
+    base='value = 1\n',
+    user='from watchpkg.base import value\n',
+    indirect='from . import user\n\ntotal = user.value + 1\n',
+    other='value = 3\n',
+)
+
+
+class WatchSpec(Spec):
+
+    def setup(self) -> None:
+        super().setup()
+        self.root = tempfile.mkdtemp()
+        self.pkg = Path(self.root) / 'watchpkg'
+        self.pkg.mkdir()
+        (self.pkg / '__init__.py').write_text('')
+        for name, source in modules.items():
+            (self.pkg / '{}.py'.format(name)).write_text(source)
+        sys.path.insert(0, self.root)
+        import watchpkg.indirect
+        import watchpkg.other  # NOQA
+
+    def teardown(self) -> None:
+        super().teardown()
+        sys.path.remove(self.root)
+        self._unload()
+
+    def _touch(self, name: str, source: str) -> str:
+        path = self.pkg / '{}.py'.format(name)
+        path.write_text(source)
+        mtime = os.path.getmtime(str(path)) + 10
+        os.utime(str(path), (mtime, mtime))
+        return str(path)
+
+    def graph(self) -> None:
+        graph = DependencyGraph(self.root)
+        affected = graph.affected({'watchpkg.base'})
+        assert affected == List('watchpkg.base', 'watchpkg.user',
+                                'watchpkg.indirect')
+        assert graph.affected({'watchpkg.other'}) == List('watchpkg.other')
+
+    def cycle(self) -> None:
+        runs = []
+        watch = Watch(self.root, runs.append)
+        watch.cycle({self._touch('base', 'value = 5\n')})
+        affected = {'watchpkg.base', 'watchpkg.user', 'watchpkg.indirect'}
+        assert runs == [affected]
+        assert sys.modules['watchpkg.indirect'].total == 6
+
+    def _unload(self) -> None:
+        for name in list(sys.modules):
+            if name.startswith('watchpkg'):
+                del sys.modules[name]
+
+    def graph_unimported(self) -> None:
+        self._unload()
+        graph = DependencyGraph(self.root)
+        affected = graph.affected({'watchpkg.base'})
+        assert affected == List('watchpkg.base', 'watchpkg.user',
+                                'watchpkg.indirect')
+        assert 'watchpkg.base' not in sys.modules
+
+    def cycle_jobs(self) -> None:
+        self._unload()
+        spec = self.pkg / 'total_spec.py'
+        spec.write_text(spec_source)
+        runs = []
+        def run(modules: set) -> Any:
+            runs.append(modules)
+            return kallikrein_run_lazy(List(str(spec)), jobs=2,
+                                       modules=modules, quiet=True)
+        watch = Watch(self.root, run)
+        result = watch.cycle({self._touch('base', 'value = 5\n')})
+        assert 'watchpkg.total_spec' in runs[0]
+        assert result.value.success
+        assert result.value.specs.length == 1
+
+    def selective_reset(self) -> None:
+        runs = []
+        watch = Watch(self.root, runs.append)
+        other = ('watchpkg.other', 'OtherSpec', '')
+        user = ('watchpkg.user', 'UserSpec', '')
+        spec_plans.plans.update({other: SpecPlan(()), user: SpecPlan(())})
+        sub = self.pkg / 'sub'
+        sub.mkdir()
+        mod = sub / 'mod.py'
+        mod.write_text('')
+        try:
+            assert resolve_module(mod) == 'mod'
+            watch.cycle({self._touch('base', 'value = 5\n')})
+            assert other in spec_plans.plans
+            assert user not in spec_plans.plans
+            assert str(self.pkg) in package_roots.packages
+            init = sub / '__init__.py'
+            init.write_text('')
+            watch.cycle({str(init)})
+            assert resolve_module(mod) == 'watchpkg.sub.mod'
+        finally:
+            spec_plans.clear()
+
+    def polling(self) -> None:
+        watcher = PollingWatcher(self.root)
+        assert watcher.changes() == set()
+        path = self._touch('other', 'value = 4\n')
+        assert watcher.wait() == {path}
+
+    def inotify(self) -> None:
+        for watcher in InotifyWatcher.create_in(self.root):
+            path = self._touch('other', 'value = 4\n')
+            assert watcher.wait() == {path}
+            watcher.close()
+
+__all__ = ('WatchSpec',)